@@ -3,9 +3,11 @@
 from .calendar_actions import CalendarActionsMixin
 from .file_actions import FileActionsMixin
 from .navigation_actions import NavigationActionsMixin
+from .widget_cache import WidgetCacheMixin
 
 __all__ = [
     "CalendarActionsMixin",
     "FileActionsMixin",
     "NavigationActionsMixin",
+    "WidgetCacheMixin",
 ]
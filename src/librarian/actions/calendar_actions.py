@@ -2,15 +2,28 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
 
-from ..calendar import CalendarEvent, fetch_todays_events, find_icalpal
+from ..calendar import (
+    CalendarEvent,
+    fetch_todays_events,
+    find_icalpal,
+    get_cached_events,
+)
 from ..calendar_store import get_association, set_association
-from ..database import get_files_by_tag
-from ..widgets import AssociateModal, FileList, Preview, TagList
+from ..database import get_file_paths_by_tag
+from ..widgets import AssociateModal, TagList
 from ..widgets.calendar_list import CalendarList
 
-from textual.widgets import Static
+
+@dataclass(frozen=True, slots=True)
+class _PendingAssoc:
+    """The meeting an open AssociateModal will be linked to."""
+
+    uid: str
+    title: str
 
 
 class CalendarActionsMixin:
@@ -25,18 +38,24 @@ class CalendarActionsMixin:
     def _fetch_calendar_events(self) -> None:
         """Fetch calendar events in a background worker."""
         if not self.config.calendar.enabled:
-            tag_list = self.query_one("#tag-list", TagList)
+            tag_list = self._tag_list
             tag_list.calendar_list.show_error("Calendar disabled in config")
             return
 
         icalpal_bin = find_icalpal(self.config.calendar.icalpal_path)
         if not icalpal_bin:
-            tag_list = self.query_one("#tag-list", TagList)
+            tag_list = self._tag_list
             tag_list.calendar_list.show_error(
                 "icalPal not found.\nInstall: brew tap ajrosen/tap && brew install icalPal"
             )
             return
 
+        # Repeat activations within the TTL skip the worker round-trip
+        events = get_cached_events(self.config.calendar.calendar_name)
+        if events is not None:
+            self._tag_list.calendar_list.update_events(events)
+            return
+
         self.run_worker(
             self._background_fetch_events,
             name="_fetch_calendar",
@@ -44,6 +63,25 @@ class CalendarActionsMixin:
             group="calendar",
         )
 
+    def _prefetch_calendar_events(self) -> None:
+        """Warm the calendar event cache in the background at startup.
+
+        The result is kept in the calendar module's TTL cache, so the first
+        activation of the Calendar panel no longer waits on icalPal.
+        """
+        if not self.config.calendar.enabled:
+            return
+
+        if not find_icalpal(self.config.calendar.icalpal_path):
+            return
+
+        self.run_worker(
+            self._background_fetch_events,
+            name="_prefetch_calendar",
+            thread=True,
+            group="calendar",
+        )
+
     def _background_fetch_events(self) -> list[CalendarEvent]:
         """Fetch calendar events in background thread."""
         return fetch_todays_events(
@@ -56,39 +94,36 @@ class CalendarActionsMixin:
     ) -> None:
         """Handle meeting highlight — show associated note in preview."""
         associated_file = get_association(event.event.uid)
+        file_list = self._file_list
+        preview = self._preview
         if associated_file:
-            file_list = self.query_one("#file-list", FileList)
             file_list.update_files([associated_file], navigation_target=event.event.title)
-            preview = self.query_one("#preview", Preview)
             await preview.show_file(associated_file)
         else:
-            preview = self.query_one("#preview", Preview)
-            info = self._format_meeting_info(event.event)
-            preview.show_content(None, info, None)
-            preview.query_one("#preview-header", Static).update(
-                f"PREVIEW - {event.event.title}"
-            )
-            file_list = self.query_one("#file-list", FileList)
             file_list.update_files([], navigation_target=event.event.title)
+            info = self._format_meeting_info(event.event)
+            await preview.show_content(None, info, None)
+            preview.set_header(f"PREVIEW - {event.event.title}")
 
     def _format_meeting_info(self, event: CalendarEvent) -> str:
         """Format a CalendarEvent as markdown for preview."""
-        lines = [f"# {event.title}", ""]
-        lines.append(f"**Time:** {event.time_range_str}")
-        if event.calendar_name:
-            lines.append(f"**Calendar:** {event.calendar_name}")
-        if event.location:
-            lines.append(f"**Location:** {event.location}")
-        if event.attendees:
-            lines.append(f"**Attendees:** {', '.join(event.attendees)}")
-        if event.notes:
-            lines.extend(["", "---", "", event.notes])
-        lines.extend(["", "", "*Press `a` to associate a note, or `n` to create one.*"])
-        return "\n".join(lines)
+        parts = [
+            f"# {event.title}",
+            "",
+            f"**Time:** {event.time_range_str}",
+            f"**Calendar:** {event.calendar_name}" if event.calendar_name else None,
+            f"**Location:** {event.location}" if event.location else None,
+            f"**Attendees:** {', '.join(event.attendees)}" if event.attendees else None,
+            *(["", "---", "", event.notes] if event.notes else []),
+            "",
+            "",
+            "*Press `a` to associate a note, or `n` to create one.*",
+        ]
+        return "\n".join(p for p in parts if p is not None)
 
     def action_associate_meeting(self) -> None:
         """Associate the selected meeting with a file from #meetings tag."""
-        tag_list = self.query_one("#tag-list", TagList)
+        tag_list = self._tag_list
         if tag_list.active_tool != "calendar":
             return
 
@@ -97,33 +132,30 @@ class CalendarActionsMixin:
             self.notify("No meeting selected", severity="warning")
             return
 
-        files = get_files_by_tag("meetings")
-        file_paths = [f[0] for f in files]
+        file_paths = get_file_paths_by_tag("meetings")
 
         if not file_paths:
             self.notify("No files with #meetings tag. Press 'n' to create one.", severity="warning")
             return
 
-        self._associating_event_uid = event.uid
-        self._associating_event_title = event.title
+        pending = _PendingAssoc(event.uid, event.title)
         self.push_screen(
             AssociateModal(event.title, file_paths),
-            self._on_associate_dismissed,
+            partial(self._on_associate_dismissed, pending),
         )
 
-    async def _on_associate_dismissed(self, result) -> None:
+    async def _on_associate_dismissed(self, pending: _PendingAssoc, result) -> None:
         """Handle associate modal dismissal."""
         if result is None:
             return
 
         file_path = result
-        event_uid = self._associating_event_uid
-        event_title = self._associating_event_title
+        event_title = pending.title
 
-        set_association(event_uid, file_path)
+        set_association(pending.uid, file_path)
         self.notify(f"Associated '{event_title}' with {file_path.name}")
 
-        file_list = self.query_one("#file-list", FileList)
+        file_list = self._file_list
         file_list.update_files([file_path], navigation_target=event_title)
-        preview = self.query_one("#preview", Preview)
+        preview = self._preview
         await preview.show_file(file_path)
@@ -2,18 +2,47 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
+import re
 import shutil
 import subprocess
 from datetime import datetime
 from pathlib import Path
 
-from ..calendar_store import set_association
-from ..database import get_files_by_tag, remove_file
-from ..export import export_markdown
-from ..scanner import rescan_file, scan_directory
-from ..widgets import FileList, MoveModal, Preview, RenameModal, TagList
-
-from textual.widgets import Static
+from ..calendar_store import remove_associations_for_file, set_association
+from ..database import get_file_tags, remove_file
+from ..scanner import rescan_file, rescan_moved_file, scan_directory
+from ..widgets import MoveModal, RenameModal
+
+# Characters stripped from event titles when deriving a note filename
+_UNSAFE_TITLE_RE = re.compile(r"[^\w \-]")
+
+
+def _write_new_file(file_path: Path, content: str) -> Path:
+    """Create a file with content without overwriting an existing one.
+
+    If the name is taken, a numeric suffix is appended to the stem.
+    Returns the path actually written.
+    """
+    candidate = file_path
+    counter = 1
+    while True:
+        try:
+            fd = os.open(candidate, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            candidate = file_path.with_name(f"{file_path.stem}-{counter}{file_path.suffix}")
+            counter += 1
+            continue
+        try:
+            # fdopen's write() retries short writes until all content is written
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+        except BaseException:
+            # Don't leave an empty or truncated note behind
+            candidate.unlink(missing_ok=True)
+            raise
+        return candidate
 
 
 class FileActionsMixin:
@@ -21,20 +50,23 @@ class FileActionsMixin:
 
     async def action_edit(self) -> None:
         """Edit the currently previewed file."""
-        preview = self.query_one("#preview", Preview)
+        preview = self._preview
         file_path = preview.get_current_file()
         if file_path:
             await self._edit_file(file_path)
+            # The file may have changed; let the next highlight reload it
+            self._current_preview_path = None
         else:
             self.notify("No file selected", severity="warning")
 
     async def action_new_file(self) -> None:
         """Create a new file. Uses .taskpaper when TaskPaper tool is active, .md otherwise."""
-        tag_list = self.query_one("#tag-list", TagList)
-        file_list = self.query_one("#file-list", FileList)
+        tag_list = self._tag_list
+        file_list = self._file_list
         tag, _, _ = file_list.get_navigation_info()
 
-        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d-%H%M%S")
 
         if tag_list.active_tool == "taskpaper":
             filename = f"new-note-{timestamp}.taskpaper"
@@ -44,32 +76,39 @@ class FileActionsMixin:
             # Create meeting note from selected event
             event = tag_list.calendar_list.get_selected_event()
             if event:
-                safe_title = "".join(
-                    c if c.isalnum() or c in " -_" else "" for c in event.title
-                ).strip().replace(" ", "-")
-                date_str = datetime.now().strftime("%Y-%m-%d")
+                safe_title = _UNSAFE_TITLE_RE.sub("", event.title).strip().replace(" ", "-")
+                date_str = now.strftime("%Y-%m-%d")
                 filename = f"{date_str}-{safe_title}.md"
                 file_path = self.config.scan_directory / filename
 
-                lines = [f"# {event.title}", ""]
-                lines.append(f"**Date:** {date_str}")
-                lines.append(f"**Time:** {event.time_range_str}")
-                if event.location:
-                    lines.append(f"**Location:** {event.location}")
-                if event.attendees:
-                    lines.extend(["", "## Attendees", ""])
-                    for attendee in event.attendees:
-                        lines.append(f"- {attendee}")
-                lines.extend(["", "## Notes", "", "", "", "#meetings"])
-                content = "\n".join(lines)
-
-                file_path.write_text(content, encoding="utf-8")
+                parts = [
+                    f"# {event.title}",
+                    "",
+                    f"**Date:** {date_str}",
+                    f"**Time:** {event.time_range_str}",
+                    f"**Location:** {event.location}" if event.location else None,
+                    *(
+                        ["", "## Attendees", "", *(f"- {a}" for a in event.attendees)]
+                        if event.attendees
+                        else []
+                    ),
+                    "",
+                    "## Notes",
+                    "",
+                    "",
+                    "",
+                    "#meetings",
+                ]
+                content = "\n".join(p for p in parts if p is not None)
+
+                # Write off the event loop; the scan directory may be a slow mount
+                file_path = await asyncio.to_thread(_write_new_file, file_path, content)
                 await self._edit_file(file_path)
 
                 # Auto-associate the new note with the event
                 set_association(event.uid, file_path)
 
-                self.run_worker(self._background_full_rescan, exclusive=True, thread=True)
+                self._rescan_new_file(file_path)
                 return
             else:
                 filename = f"meeting-{timestamp}.md"
@@ -84,18 +123,28 @@ class FileActionsMixin:
                 lines.append("")
             content = "\n".join(lines)
 
-        file_path.write_text(content, encoding="utf-8")
+        file_path = await asyncio.to_thread(_write_new_file, file_path, content)
         await self._edit_file(file_path)
 
-        # Trigger a rescan to pick up the new file
-        self.run_worker(self._background_full_rescan, exclusive=True, thread=True)
+        self._rescan_new_file(file_path)
+
+    def _rescan_new_file(self, file_path: Path) -> None:
+        """Index a newly created file in the background."""
+        self.run_worker(
+            lambda: rescan_file(file_path, self.config),
+            name="_rescan_new_file",
+            thread=True,
+        )
 
     async def _edit_file(self, file_path: Path) -> None:
         """Open a file in the configured editor."""
-        if file_path.suffix == ".taskpaper" and self.config.taskpaper:
+        is_taskpaper = file_path.name.endswith(".taskpaper")
+        if is_taskpaper and self.config.taskpaper:
             editor = self.config.taskpaper
+            is_gui = False
         else:
             editor = self.config.editor
+            is_gui = self.config.editor_is_gui
 
         # Validate editor command exists on PATH or as absolute path
         editor_path = Path(editor)
@@ -103,6 +152,15 @@ class FileActionsMixin:
             self.notify(f"Editor '{editor}' not found on PATH", severity="error")
             return
 
+        if is_gui:
+            # GUI editors don't need the terminal; keep the TUI running
+            self.run_worker(
+                self._run_gui_editor(editor, file_path),
+                name="_gui_editor",
+                group="editor",
+            )
+            return
+
         with self.suspend():
             try:
                 subprocess.run([editor, str(file_path)], check=False)
@@ -111,9 +169,29 @@ class FileActionsMixin:
             except Exception as e:
                 self.notify(f"Error opening editor: {e}", severity="error")
 
+    async def _run_gui_editor(self, editor: str, file_path: Path) -> None:
+        """Launch a GUI editor and wait for it to exit without blocking the UI."""
+        try:
+            # Detach from the terminal so editor output can't corrupt the screen
+            # and the editor can't read the app's keystrokes
+            proc = await asyncio.create_subprocess_exec(
+                editor,
+                str(file_path),
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+        except FileNotFoundError:
+            self.notify(f"Editor '{editor}' not found", severity="error")
+            return
+        except Exception as e:
+            self.notify(f"Error opening editor: {e}", severity="error")
+            return
+        await proc.wait()
+
     def action_rename_file(self) -> None:
         """Show rename modal for the currently selected file."""
-        file_list = self.query_one("#file-list", FileList)
+        file_list = self._file_list
         file_path = file_list.get_selected_file()
         if file_path:
             self.push_screen(RenameModal(file_path), self._on_rename_dismissed)
@@ -130,21 +208,24 @@ class FileActionsMixin:
         if action == "renamed":
             self.notify(f"Renamed to {new_path.name}")
 
-        remove_file(old_path)
-        rescan_file(new_path, self.config)
+        self._refresh_after_move(old_path, new_path)
 
-        self._refresh_tags()
-        tag_list = self.query_one("#tag-list", TagList)
-        selected_tag = tag_list.get_selected_tag()
-        if selected_tag:
-            files = get_files_by_tag(selected_tag)
-            file_paths = [f[0] for f in files]
-            file_list = self.query_one("#file-list", FileList)
-            file_list.update_files(file_paths, selected_tag)
+    def _refresh_after_move(self, old_path: Path, new_path: Path) -> None:
+        """Reindex a renamed or moved file and refresh the views it appears in."""
+        affected_tags = set(get_file_tags(old_path))
+        rescan_moved_file(old_path, new_path, self.config)
+        affected_tags.update(get_file_tags(new_path))
+
+        selected_tag = self._tag_list.get_selected_tag()
+        self._refresh_tags(
+            update_file_list=(
+                selected_tag in affected_tags or self._file_list.contains(old_path)
+            )
+        )
 
     def action_move_file(self) -> None:
         """Show move modal for the currently selected file."""
-        file_list = self.query_one("#file-list", FileList)
+        file_list = self._file_list
         file_path = file_list.get_selected_file()
         if file_path:
             self.push_screen(MoveModal(file_path), self._on_move_dismissed)
@@ -161,28 +242,18 @@ class FileActionsMixin:
         if action == "moved":
             self.notify(f"Moved to {new_path.parent}")
 
-        remove_file(old_path)
-        rescan_file(new_path, self.config)
-
-        self._refresh_tags()
-        tag_list = self.query_one("#tag-list", TagList)
-        selected_tag = tag_list.get_selected_tag()
-        if selected_tag:
-            files = get_files_by_tag(selected_tag)
-            file_paths = [f[0] for f in files]
-            file_list = self.query_one("#file-list", FileList)
-            file_list.update_files(file_paths, selected_tag)
+        self._refresh_after_move(old_path, new_path)
 
     def action_delete_file(self) -> None:
         """Delete the currently selected file after confirmation."""
-        file_list = self.query_one("#file-list", FileList)
+        file_list = self._file_list
         file_path = file_list.get_selected_file()
         if not file_path:
             self.notify("No file selected", severity="warning")
             return
 
-        if getattr(self, "_pending_delete", None) == file_path:
-            self._pending_delete = None
+        if self._pending_delete == file_path:
+            self._clear_pending_delete()
             try:
                 file_path.unlink()
             except OSError as e:
@@ -192,28 +263,30 @@ class FileActionsMixin:
             self.notify(f"Deleted {file_path.name}")
 
             remove_file(file_path)
-            self._refresh_tags()
-
-            tag_list = self.query_one("#tag-list", TagList)
-            selected_tag = tag_list.get_selected_tag()
-            if selected_tag:
-                files = get_files_by_tag(selected_tag)
-                file_paths = [f[0] for f in files]
-                file_list.update_files(file_paths, selected_tag)
+            remove_associations_for_file(file_path)
+            self._refresh_tags(update_file_list=True)
 
-            preview = self.query_one("#preview", Preview)
-            preview.query_one("#preview-header", Static).update("PREVIEW")
+            self._preview.set_header("PREVIEW")
         else:
+            self._clear_pending_delete()
             self._pending_delete = file_path
+            self._pending_delete_timer = self.set_timer(3, self._clear_pending_delete)
             self.notify(
                 f"Press d again to delete {file_path.name}",
                 severity="warning",
                 timeout=3,
             )
 
+    def _clear_pending_delete(self) -> None:
+        """Forget the pending delete confirmation and stop its expiry timer."""
+        if self._pending_delete_timer is not None:
+            self._pending_delete_timer.stop()
+            self._pending_delete_timer = None
+        self._pending_delete = None
+
     def action_export(self) -> None:
         """Export the currently previewed file to HTML."""
-        preview = self.query_one("#preview", Preview)
+        preview = self._preview
         file_path = preview.get_current_file()
 
         if not file_path:
@@ -221,12 +294,26 @@ class FileActionsMixin:
             return
 
         self.notify(f"Exporting {file_path.name}...")
+
+        def export() -> tuple[Path, str]:
+            # Imported here, in the worker: Python-Markdown is only needed
+            # once something is exported, so it stays off the startup path
+            from ..export import export_markdown
+
+            return export_markdown(file_path, self.config.export_directory)
+
         self.run_worker(
-            lambda: export_markdown(file_path, self.config.export_directory),
+            export,
             name="_export_file",
             thread=True,
         )
 
+    def _background_update(self) -> tuple[int, int, int]:
+        """Run a manual rescan in background thread, rereading only changed files."""
+        return scan_directory(self.config, on_progress=self._on_scan_progress)
+
     def _background_full_rescan(self) -> tuple[int, int, int]:
-        """Run full rescan in background thread."""
-        return scan_directory(self.config, full_rescan=True)
+        """Run a manual rescan in background thread, rereading every file."""
+        return scan_directory(
+            self.config, full_rescan=True, on_progress=self._on_scan_progress
+        )
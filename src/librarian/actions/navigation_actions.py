@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+from functools import cached_property
 from pathlib import Path
 
+from textual.widget import Widget
+
 from ..database import resolve_wiki_link
 from ..navigation import NavigationState
-from ..widgets import FileList, Preview, TagList
+from ..widgets import FileList, Preview
 from ..widgets.calendar_list import CalendarList
 
 
@@ -15,7 +18,7 @@ class NavigationActionsMixin:
 
     def _get_focus_widget(self, widget_id: str):
         """Get a focusable widget by ID."""
-        tag_list = self.query_one("#tag-list", TagList)
+        tag_list = self._tag_list
         if widget_id == "tools-list-view":
             return tag_list.tools_list_view
         elif widget_id == "all-tags-list-view":
@@ -25,46 +28,60 @@ class NavigationActionsMixin:
                 return tag_list.calendar_list.list_view
             return tag_list.all_tags_list_view
         elif widget_id == "file-list-view":
-            return self.query_one("#file-list", FileList).list_view
+            return self._file_list.list_view
         elif widget_id == "preview":
-            return self.query_one("#preview", Preview).scroll_view
+            return self._preview.scroll_view
         return None
 
+    @cached_property
+    def _focus_widgets(self) -> tuple[tuple[Widget, int], ...]:
+        """Focusable panel widgets paired with their FOCUS_ORDER index.
+
+        Every content-panel widget is composed up front and only toggled
+        visible, so the pairs are stable across tool switches.
+        """
+        tag_list = self._tag_list
+        return (
+            (tag_list.tools_list_view, 0),
+            (self._file_list.list_view, 1),
+            (self._preview.scroll_view, 2),
+            (tag_list.all_tags_list_view, 3),
+            (tag_list.directory_tree, 3),
+            (tag_list.calendar_list.list_view, 3),
+        )
+
     def _get_current_focus_index(self) -> int:
         """Get the index of the currently focused widget in FOCUS_ORDER."""
         focused = self.focused
         if focused is None:
             return -1
-
-        tag_list = self.query_one("#tag-list", TagList)
-        file_list = self.query_one("#file-list", FileList)
-        preview = self.query_one("#preview", Preview)
-
-        focus_map = {
-            id(tag_list.tools_list_view): 0,
-            id(file_list.list_view): 1,
-            id(preview.scroll_view): 2,
-            id(tag_list.all_tags_list_view): 3,
-            id(tag_list.directory_tree): 3,
-            id(tag_list.calendar_list.list_view): 3,
-        }
-        return focus_map.get(id(focused), -1)
+        for widget, index in self._focus_widgets:
+            if focused is widget:
+                return index
+        return -1
+
+    def _get_focus_order(self) -> tuple[Widget, ...]:
+        """Get the FOCUS_ORDER widgets for the active tool, resolving them once per tool."""
+        active_tool = self._tag_list.active_tool
+        order = self._focus_orders.get(active_tool)
+        if order is None:
+            order = tuple(
+                self._get_focus_widget(widget_id) for widget_id in self.FOCUS_ORDER
+            )
+            self._focus_orders[active_tool] = order
+        return order
 
     def action_focus_next(self) -> None:
         """Focus the next panel in clockwise order."""
+        order = self._get_focus_order()
         current = self._get_current_focus_index()
-        next_index = (current + 1) % len(self.FOCUS_ORDER)
-        widget = self._get_focus_widget(self.FOCUS_ORDER[next_index])
-        if widget:
-            widget.focus()
+        order[(current + 1) % len(order)].focus()
 
     def action_focus_previous(self) -> None:
         """Focus the previous panel in counter-clockwise order."""
+        order = self._get_focus_order()
         current = self._get_current_focus_index()
-        prev_index = (current - 1) % len(self.FOCUS_ORDER)
-        widget = self._get_focus_widget(self.FOCUS_ORDER[prev_index])
-        if widget:
-            widget.focus()
+        order[(current - 1) % len(order)].focus()
 
     async def on_preview_wiki_link_clicked(
         self, event: Preview.WikiLinkClicked
@@ -78,7 +95,7 @@ class NavigationActionsMixin:
             self.notify(f"Link target not found: {event.target}", severity="warning")
             return
 
-        file_list = self.query_one("#file-list", FileList)
+        file_list = self._file_list
         tag, files, index = file_list.get_navigation_info()
         header_text = file_list.get_header_text()
         state = NavigationState(
@@ -90,21 +107,14 @@ class NavigationActionsMixin:
         self._nav_stack.push(state)
 
         file_list.update_files([resolved], navigation_target=resolved.name)
-
-        preview = self.query_one("#preview", Preview)
+        preview = self._preview
         await preview.show_file(resolved)
 
-        def activate_file_list():
-            file_list.list_view.focus()
-            if len(file_list._files) > 1:
-                file_list.list_view.action_cursor_down()
-                file_list.list_view.action_cursor_up()
-
-        self.set_timer(0.1, activate_file_list)
+        self.call_after_refresh(file_list.activate)
 
     async def action_go_back(self) -> None:
         """Go back in navigation history or exit search mode."""
-        file_list = self.query_one("#file-list", FileList)
+        file_list = self._file_list
         if file_list.is_search_mode():
             file_list.exit_search_mode()
             return
@@ -116,7 +126,6 @@ class NavigationActionsMixin:
         if state is None:
             return
 
-        file_list = self.query_one("#file-list", FileList)
         file_list.restore_state(
             files=state.files,
             tag=state.tag,
@@ -125,20 +134,14 @@ class NavigationActionsMixin:
         )
 
         if state.files and 0 <= state.selected_index < len(state.files):
-            preview = self.query_one("#preview", Preview)
+            preview = self._preview
             await preview.show_file(state.files[state.selected_index])
 
-        def activate_file_list():
-            file_list.list_view.focus()
-            if len(state.files) > 1:
-                file_list.list_view.action_cursor_down()
-                file_list.list_view.action_cursor_up()
-
-        self.set_timer(0.1, activate_file_list)
+        self.call_after_refresh(file_list.activate)
 
     def action_search(self) -> None:
         """Enter search mode."""
-        file_list = self.query_one("#file-list", FileList)
+        file_list = self._file_list
         if not file_list.is_search_mode():
             file_list.enter_search_mode()
 
@@ -146,12 +149,12 @@ class NavigationActionsMixin:
         self, event: FileList.SearchModeExited
     ) -> None:
         """Handle search mode exit - restore focus to tools list."""
-        tag_list = self.query_one("#tag-list", TagList)
+        tag_list = self._tag_list
         tag_list.tools_list_view.focus()
 
     def action_help(self) -> None:
         """Show help information."""
         self.notify(
-            "s=Search, n=New, e=Edit, d=Delete, x=Export, r=Rename, m=Move, t=TaskPaper, a=Associate, u=Update, q=Quit",
+            "s=Search, n=New, e=Edit, d=Delete, x=Export, r=Rename, m=Move, t=TaskPaper, a=Associate, u=Update, U=Full Rescan, q=Quit",
             timeout=5,
         )
@@ -0,0 +1,27 @@
+"""Cached widget handles for LibrarianApp."""
+
+from __future__ import annotations
+
+from functools import cached_property
+
+from ..widgets import FileList, Preview, TagList
+
+
+class WidgetCacheMixin:
+    """Mixin resolving the app's singleton panels once instead of per query.
+
+    The panels are composed once and live for the whole app lifetime, so the
+    first successful lookup is cached on the instance.
+    """
+
+    @cached_property
+    def _tag_list(self) -> TagList:
+        return self.query_one("#tag-list", TagList)
+
+    @cached_property
+    def _file_list(self) -> FileList:
+        return self.query_one("#file-list", FileList)
+
+    @cached_property
+    def _preview(self) -> Preview:
+        return self.query_one("#preview", Preview)
@@ -1,34 +1,53 @@
 """Main Textual application for Librarian."""
 
+import threading
+import time
 from pathlib import Path
 
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
 from textual.timer import Timer
-from textual.widgets import Footer, Static
+from textual.widget import Widget
+from textual.widgets import Footer
 from textual.worker import Worker
 
-from .actions import CalendarActionsMixin, FileActionsMixin, NavigationActionsMixin
+from .actions import (
+    CalendarActionsMixin,
+    FileActionsMixin,
+    NavigationActionsMixin,
+    WidgetCacheMixin,
+)
 from .calendar import clear_cache as clear_calendar_cache
 from .calendar_store import init_store
 from .config import Config
-from .database import (
-    get_all_tags,
-    get_files_by_tag,
-    init_database,
-)
+from .database import get_file_paths_by_tag, get_tag_snapshot, init_database
 from .navigation import NavigationStack
-from .scanner import scan_directory
+from .scanner import prepare_parallel_scan, scan_directory
 from .watcher import FileWatcher
-from .widgets import Banner, CalendarList, FileList, Preview, TagList, load_file_content
-from .widgets.tag_list import TagItem
+from .widgets import (
+    Banner,
+    CalendarList,
+    FileList,
+    Preview,
+    TagList,
+    get_cached_content,
+    load_file_content,
+)
+
+
+# Quiet period after a highlight before the preview follows the cursor
+PREVIEW_DEBOUNCE_SECONDS = 0.05
+
+# Minimum gap between tag list refreshes while a scan streams in results
+SCAN_PROGRESS_INTERVAL = 0.25
 
 
 class LibrarianApp(
     FileActionsMixin,
     CalendarActionsMixin,
     NavigationActionsMixin,
+    WidgetCacheMixin,
     App,
 ):
     """Librarian - Markdown Tag Browser TUI."""
@@ -36,46 +55,14 @@ class LibrarianApp(
     TITLE = "Librarian"
     SUB_TITLE = "Markdown Tag Browser"
 
-    CSS = """
-    #main-container {
-        width: 100%;
-        height: 1fr;
-    }
-
-    #tag-list {
-        width: 25%;
-        height: 100%;
-    }
-
-    #right-panel {
-        width: 75%;
-        height: 100%;
-    }
-
-    #file-list {
-        height: 33%;
-        border: solid $warning;
-    }
-
-    #file-list:focus-within {
-        border: solid yellow;
-    }
-
-    #preview {
-        height: 67%;
-        border: solid $success;
-    }
-
-    #preview:focus-within {
-        border: solid green;
-    }
-    """
+    CSS_PATH = "app.tcss"
 
     BINDINGS = [
         Binding("q", "quit", "Quit"),
         Binding("n", "new_file", "New"),
         Binding("e", "edit", "Edit"),
         Binding("u", "update", "Update"),
+        Binding("U", "full_rescan", "Full Rescan", show=False),
         Binding("s", "search", "Search"),
         Binding("tab", "focus_next", "Next Panel", show=False),
         Binding("shift+tab", "focus_previous", "Prev Panel", show=False),
@@ -103,7 +90,21 @@ class LibrarianApp(
         self._watcher: FileWatcher | None = None
         self._nav_stack = NavigationStack()
         self._preview_timer: Timer | None = None
+        self._highlighted_preview_path: Path | None = None
+        self._last_preview_fire: float = 0.0  # monotonic time of the last preview update
+        self._refresh_timer: Timer | None = None
+        self._file_change_lock = threading.Lock()
+        self._file_change_scheduled = False
+        self._changed_tags: set[str] = set()
+        self._last_status: tuple[str, float] = ("", 0.0)  # (message, monotonic time)
+        self._last_scan_progress: float = 0.0
         self._pending_preview_path: Path | None = None
+        self._current_preview_path: Path | None = None
+        self._refresh_file_list_pending = False
+        self._last_tags: list[tuple[str, int]] | None = None
+        self._focus_orders: dict[str, tuple[Widget, ...]] = {}
+        self._pending_delete: Path | None = None
+        self._pending_delete_timer: Timer | None = None
 
     def compose(self) -> ComposeResult:
         yield Banner()
@@ -120,24 +121,48 @@ class LibrarianApp(
 
     async def on_mount(self) -> None:
         """Initialize the app after mounting."""
-        init_database(self.config.get_index_path())
-        init_store(self.config.data_directory)
-        self._refresh_tags()
-
-        tag_list = self.query_one("#tag-list", TagList)
+        self._preview_timer = self.set_interval(
+            PREVIEW_DEBOUNCE_SECONDS, self._preview_tick, pause=True
+        )
+        # Only records the index path; the index itself is loaded lazily by
+        # the first _load_tags worker, off the UI thread
+        index_path = self.config.get_index_path()
+        init_database(index_path)
+        # With no saved index there is nothing to show yet; the scan's
+        # completion populates the tag list in a single refresh
+        if index_path.exists():
+            self._refresh_tags()
+
+        tag_list = self._tag_list
         tag_list.tools_list_view.focus()
 
-        self._watcher = FileWatcher(self.config, self._on_file_change)
-        self._watcher.start()
+        # Registering watches walks the whole tree; do it after first paint
+        self.call_after_refresh(self._start_watcher)
 
         self.notify("Scanning files...")
         self.run_worker(self._background_scan, exclusive=True, thread=True)
 
+        self._prefetch_calendar_events()
+
+    def _start_watcher(self) -> None:
+        """Start watching the scan directory for changes."""
+        self._watcher = FileWatcher(self.config, self._on_file_change)
+        self._watcher.start()
+
     def _background_scan(self) -> tuple[int, int, int]:
-        """Run directory scan in background thread."""
-        return scan_directory(self.config)
+        """Load the calendar store and run the directory scan in a background thread."""
+        init_store(self.config.data_directory)
+        return scan_directory(self.config, on_progress=self._on_scan_progress)
+
+    def _on_scan_progress(self) -> None:
+        """Show partial scan results (called from the scan thread), at most ~4x a second."""
+        now = time.monotonic()
+        if now - self._last_scan_progress < SCAN_PROGRESS_INTERVAL:
+            return
+        self._last_scan_progress = now
+        self.call_from_thread(self._refresh_tags)
 
-    def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
+    async def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
         """Handle background worker completion."""
         worker_name = event.worker.name
 
@@ -149,23 +174,29 @@ class LibrarianApp(
         if event.state.name != "SUCCESS":
             return
 
-        if worker_name in ("_background_scan", "_background_full_rescan"):
+        if worker_name in ("_background_scan", "_background_update", "_background_full_rescan"):
             result = event.worker.result
             if result:
                 added, updated, removed = result
-                if worker_name == "_background_full_rescan":
-                    self.notify(f"Rescan complete: {added} added, {updated} updated, {removed} removed")
+                if not (added or updated or removed):
+                    # Index unchanged; the widgets already show current data
+                    if worker_name != "_background_scan":
+                        self.notify("Index is up to date")
+                    return
+                if worker_name != "_background_scan":
+                    self._notify_status(f"Rescan complete: {added} added, {updated} updated, {removed} removed")
                 else:
-                    self.notify(f"Index updated: {added} added, {updated} updated, {removed} removed")
-                self._refresh_tags()
+                    self._notify_status(f"Index updated: {added} added, {updated} updated, {removed} removed")
+                self._refresh_tags(update_file_list=True)
 
-                tag_list = self.query_one("#tag-list", TagList)
-                selected_tag = tag_list.get_selected_tag()
-                if selected_tag:
-                    files = get_files_by_tag(selected_tag)
-                    file_paths = [f[0] for f in files]
-                    file_list = self.query_one("#file-list", FileList)
-                    file_list.update_files(file_paths, selected_tag)
+        elif worker_name == "_rescan_new_file":
+            if event.worker.result:
+                self._refresh_tags(update_file_list=True)
+
+        elif worker_name == "_load_tags":
+            # Tag list and file list changes land in a single repaint
+            with self.batch_update():
+                await self._apply_tags(event.worker.result)
 
         elif worker_name == "_export_file":
             result = event.worker.result
@@ -176,7 +207,7 @@ class LibrarianApp(
         elif worker_name == "_fetch_calendar":
             result = event.worker.result
             if result is not None:
-                tag_list = self.query_one("#tag-list", TagList)
+                tag_list = self._tag_list
                 tag_list.calendar_list.update_events(result)
 
         elif worker_name == "_load_preview":
@@ -186,22 +217,20 @@ class LibrarianApp(
             if file_path is None:
                 return
 
-            file_list = self.query_one("#file-list", FileList)
-            if file_path not in file_list._files:
+            file_list = self._file_list
+            if not file_list.contains(file_path):
                 return
 
             result = event.worker.result
             if result:
                 content, error = result
-                preview = self.query_one("#preview", Preview)
-                self.call_later(
-                    lambda: preview.show_content(file_path, content, error)
-                )
+                await self._preview.show_content(file_path, content, error)
+                self._current_preview_path = file_path
 
     def on_app_focus(self) -> None:
         """Handle app regaining focus — invalidate calendar cache."""
         clear_calendar_cache()
-        tag_list = self.query_one("#tag-list", TagList)
+        tag_list = self._tag_list
         if tag_list.active_tool == "calendar":
             self._fetch_calendar_events()
 
@@ -210,99 +239,201 @@ class LibrarianApp(
         if self._watcher:
             self._watcher.stop()
 
-    def _refresh_tags(self) -> None:
-        """Refresh the tag list from the database."""
-        tags = get_all_tags()
-        tag_list = self.query_one("#tag-list", TagList)
-        tag_list.update_tags(tags)
+    def _refresh_tags(self, update_file_list: bool = False) -> None:
+        """Refresh the tag list from the database in a background thread.
 
-    def _on_file_change(self) -> None:
-        """Handle file system changes (called from watcher thread)."""
-        self.call_from_thread(self._handle_file_change)
+        Args:
+            update_file_list: Also reload the file list for the selected tag
+                once the new tags have been applied.
+        """
+        self._refresh_file_list_pending |= update_file_list
+        self.run_worker(
+            self._load_tags,
+            name="_load_tags",
+            thread=True,
+            group="tags",
+            exclusive=True,
+        )
 
-    def _handle_file_change(self) -> None:
-        """Handle file changes on the main thread."""
-        self._refresh_tags()
+    def _load_tags(self) -> list[tuple[str, int]]:
+        """Query tags in a background thread, priming the tag snapshot."""
+        tags, _ = get_tag_snapshot()
+        return tags
+
+    async def _apply_tags(self, tags: list[tuple[str, int]]) -> None:
+        """Apply loaded tags to the tag list and, if requested, the file list."""
+        tags_unchanged = tags == self._last_tags
+        self._last_tags = tags
+        tag_list = self._tag_list
+        if not tags_unchanged:
+            tag_list.update_tags(tags)
+
+        if not self._refresh_file_list_pending:
+            return
+        self._refresh_file_list_pending = False
 
-        tag_list = self.query_one("#tag-list", TagList)
         selected_tag = tag_list.get_selected_tag()
-        if selected_tag:
-            files = get_files_by_tag(selected_tag)
-            file_paths = [f[0] for f in files]
-            file_list = self.query_one("#file-list", FileList)
-            file_list.update_files(file_paths, selected_tag)
+        if not selected_tag:
+            return
+
+        file_paths = get_file_paths_by_tag(selected_tag)
+        file_list = self._file_list
+        if tags_unchanged and file_list.is_showing(file_paths, selected_tag):
+            # Same files in the same order: keep the list and cursor as they are
+            return
+
+        await file_list.refresh_files(file_paths, selected_tag)
 
-        self.notify("Index updated")
+    def _on_file_change(self, affected_tags: set[str]) -> None:
+        """Handle file system changes (called from watcher thread).
+
+        Only one hop to the main thread is in flight at a time; changes
+        reported meanwhile are picked up by the pending refresh.
+        """
+        with self._file_change_lock:
+            self._changed_tags |= affected_tags
+            if self._file_change_scheduled:
+                return
+            self._file_change_scheduled = True
+        self.call_from_thread(self._handle_file_change)
+
+    def _handle_file_change(self) -> None:
+        """Handle file changes on the main thread, coalescing bursts into one refresh."""
+        with self._file_change_lock:
+            self._file_change_scheduled = False
+        if self._refresh_timer is None:
+            self._refresh_timer = self.set_timer(0.05, self._flush_refresh)
+
+    def _flush_refresh(self) -> None:
+        """Refresh tags and the file list once after a burst of file changes."""
+        self._refresh_timer = None
+        with self._file_change_lock:
+            changed_tags = self._changed_tags
+            self._changed_tags = set()
+
+        # Only reload the file list if a changed file carries the selected tag
+        selected_tag = self._tag_list.get_selected_tag()
+        if selected_tag in changed_tags:
+            # The shown file may have been edited: force its preview to reload
+            self._current_preview_path = None
+            selected_file = self._file_list.get_selected_file()
+            if selected_file is not None:
+                self.call_later(self._do_preview_update, selected_file)
+        self._refresh_tags(update_file_list=selected_tag in changed_tags)
+
+        self._notify_status("Index updated")
+
+    def _notify_status(self, message: str) -> None:
+        """Show an index status toast, dropping repeats while the last one is still up.
+
+        Watcher refreshes during a bulk change (e.g. a git pull) would
+        otherwise stack one identical toast per flush.
+        """
+        now = time.monotonic()
+        last_message, last_time = self._last_status
+        if message == last_message and now - last_time < self.NOTIFICATION_TIMEOUT:
+            return
+        self._last_status = (message, now)
+        self.notify(message)
 
     async def on_tag_list_tag_selected(self, event: TagList.TagSelected) -> None:
         """Handle tag selection."""
         self._nav_stack.clear()
+        self._current_preview_path = None
 
-        files = get_files_by_tag(event.tag_name)
-        file_paths = [f[0] for f in files]
-        file_list = self.query_one("#file-list", FileList)
-        file_list.update_files(file_paths, event.tag_name)
+        file_paths = get_file_paths_by_tag(event.tag_name)
+        file_list = self._file_list
+        with self.batch_update():
+            file_list.update_files(file_paths, event.tag_name)
+            if file_paths:
+                file_list.list_view.focus()
 
+        # Outside the batch: rendering the preview must not freeze the screen
         if not file_paths:
-            preview = self.query_one("#preview", Preview)
+            preview = self._preview
             await preview.show_file(None)
-        else:
-            file_list.list_view.focus()
 
     async def on_file_list_file_highlighted(
         self, event: FileList.FileHighlighted
     ) -> None:
         """Handle file highlight (cursor moved) - update preview with debouncing."""
-        if self._preview_timer is not None:
-            self._preview_timer.stop()
-            self._preview_timer = None
+        if not self._file_list.contains(event.file_path):
+            self._highlighted_preview_path = None
+            self._preview_timer.pause()
+            return
 
-        file_list = self.query_one("#file-list", FileList)
-        if event.file_path not in file_list._files:
+        # Leading edge: a lone cursor move previews at once. Highlights that
+        # follow within the debounce window fall through to the timer.
+        now = time.monotonic()
+        if (
+            self._highlighted_preview_path is None
+            and self._pending_preview_path is None
+            and now - self._last_preview_fire > PREVIEW_DEBOUNCE_SECONDS
+        ):
+            self._last_preview_fire = now
+            await self._do_preview_update(event.file_path)
             return
 
-        file_path = event.file_path
+        # Restart the single debounce timer rather than creating a new one
+        self._highlighted_preview_path = event.file_path
+        self._preview_timer.reset()
 
-        self._preview_timer = self.set_timer(
-            0.05,
-            lambda: self._do_preview_update(file_path),
-        )
+    async def _preview_tick(self) -> None:
+        """Fire a debounced preview update, then go idle until the next highlight."""
+        self._preview_timer.pause()
+        file_path = self._highlighted_preview_path
+        self._highlighted_preview_path = None
+        if file_path is not None:
+            self._last_preview_fire = time.monotonic()
+            await self._do_preview_update(file_path)
 
-    def _do_preview_update(self, file_path: Path) -> None:
+    async def _do_preview_update(self, file_path: Path) -> None:
         """Actually update the preview after debounce delay."""
-        self._preview_timer = None
+        file_list = self._file_list
+        if not file_list.contains(file_path):
+            return
 
-        file_list = self.query_one("#file-list", FileList)
-        if file_path not in file_list._files:
+        # Skip reloading the file that is already on screen
+        if (
+            self._pending_preview_path is None
+            and file_path == self._current_preview_path
+            and file_path == self._preview.get_current_file()
+        ):
             return
 
-        preview = self.query_one("#preview", Preview)
-        preview.query_one("#preview-header", Static).update(
-            f"PREVIEW - {file_path.name}"
-        )
+        self._preview.set_header(f"PREVIEW - {file_path.name}")
+
+        # Recently viewed, unchanged files are shown without a worker round-trip
+        content = get_cached_content(file_path)
+        if content is not None:
+            self.workers.cancel_group(self, "preview")
+            self._pending_preview_path = None
+            await self._preview.show_content(file_path, content, None)
+            self._current_preview_path = file_path
+            return
 
         self.run_worker(
             lambda: load_file_content(file_path),
             name="_load_preview",
             thread=True,
             group="preview",
+            exclusive=True,
         )
         self._pending_preview_path = file_path
 
     def _select_taskpaper_tag(self) -> None:
         """Select the #taskpaper tag and show its files."""
-        tag_list = self.query_one("#tag-list", TagList)
+        tag_list = self._tag_list
         tag_list._switch_panel("tags")
         tag_list.active_tool = "taskpaper"
 
-        all_list = tag_list.all_tags_list_view
-        for i, item in enumerate(all_list.children):
-            if isinstance(item, TagItem) and item.tag_name.lower() == "taskpaper":
-                all_list.index = i
-                tag_list.post_message(TagList.TagSelected("taskpaper"))
-                return
+        index = tag_list.index_of_tag("taskpaper")
+        if index is None:
+            self.notify("No #taskpaper tag found in index", severity="warning")
+            return
 
-        self.notify("No #taskpaper tag found in index", severity="warning")
+        tag_list.all_tags_list_view.index = index
+        tag_list.post_message(TagList.TagSelected("taskpaper"))
 
     def action_launch_taskpaper(self) -> None:
         """Select the #taskpaper tag via the `t` keybinding."""
@@ -321,21 +452,29 @@ class LibrarianApp(
 
         self._nav_stack.clear()
 
-        file_list = self.query_one("#file-list", FileList)
-        file_list.update_files([file_path], navigation_target=file_path.name)
+        file_list = self._file_list
+        # File list and preview change together; paint them in one pass
+        with self.batch_update():
+            file_list.update_files([file_path], navigation_target=file_path.name)
+            file_list.list_view.focus()
 
-        preview = self.query_one("#preview", Preview)
+        # Outside the batch: rendering the preview must not freeze the screen
+        preview = self._preview
         await preview.show_file(file_path)
 
-        file_list.list_view.focus()
-
     async def action_update(self) -> None:
         """Manually update the index."""
         self.notify("Updating...")
+        self.run_worker(self._background_update, exclusive=True, thread=True)
+
+    async def action_full_rescan(self) -> None:
+        """Reread every file, rebuilding the index from scratch."""
+        self.notify("Rescanning all files...")
         self.run_worker(self._background_full_rescan, exclusive=True, thread=True)
 
 
 def run_app(config: Config) -> None:
     """Run the Librarian application."""
+    prepare_parallel_scan()
     app = LibrarianApp(config)
     app.run()
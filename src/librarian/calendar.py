@@ -6,7 +6,8 @@ import shutil
 import subprocess
 import time
 from dataclasses import dataclass, field
-from datetime import datetime
+from functools import lru_cache
+from datetime import date, datetime
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -37,15 +38,20 @@ class CalendarEvent:
         return f"{self.start.strftime('%-I:%M %p')} - {self.end.strftime('%-I:%M %p')}"
 
 
-# Simple TTL cache for calendar events
+# Simple TTL cache for calendar events (unfiltered, for the day they were fetched)
 _cache_result: list[CalendarEvent] | None = None
 _cache_time: float = 0
+_cache_date: date | None = None
 _CACHE_TTL = 300  # 5 minutes
 
 
+@lru_cache(maxsize=None)
 def find_icalpal(config_path: str = "") -> str | None:
     """Find the icalPal binary.
 
+    The lookup walks PATH, so results are memoized per config path for the
+    lifetime of the process.
+
     Args:
         config_path: Optional path from config. Checked first.
 
@@ -139,14 +145,12 @@ def fetch_todays_events(
     Returns:
         List of CalendarEvent sorted by start time.
     """
-    global _cache_result, _cache_time
+    global _cache_result, _cache_time, _cache_date
 
     # Check cache
-    if use_cache and _cache_result is not None:
-        if time.time() - _cache_time < _CACHE_TTL:
-            events = _cache_result
-            if calendar_name:
-                events = [e for e in events if e.calendar_name == calendar_name]
+    if use_cache:
+        events = get_cached_events(calendar_name)
+        if events is not None:
             return events
 
     binary = find_icalpal(icalpal_path)
@@ -184,6 +188,7 @@ def fetch_todays_events(
     # Update cache (before filtering)
     _cache_result = events
     _cache_time = time.time()
+    _cache_date = date.today()
     logger.info("Fetched %d calendar events", len(events))
 
     # Filter by calendar name if specified
@@ -193,8 +198,29 @@ def fetch_todays_events(
     return events
 
 
+def get_cached_events(calendar_name: str = "") -> list[CalendarEvent] | None:
+    """Get today's events from the TTL cache without running icalPal.
+
+    Args:
+        calendar_name: Filter to specific calendar (empty = all).
+
+    Returns:
+        The cached events, or None if the cache is empty, expired, or from
+        a previous day.
+    """
+    if _cache_result is None or _cache_date != date.today():
+        return None
+    if time.time() - _cache_time >= _CACHE_TTL:
+        return None
+    events = _cache_result
+    if calendar_name:
+        events = [e for e in events if e.calendar_name == calendar_name]
+    return events
+
+
 def clear_cache() -> None:
     """Clear the event cache, forcing a fresh fetch."""
-    global _cache_result, _cache_time
+    global _cache_result, _cache_time, _cache_date
     _cache_result = None
     _cache_time = 0
+    _cache_date = None
@@ -18,6 +18,15 @@ _store_path: Path | None = None
 _associations: dict[str, Association] = {}
 _write_lock = threading.Lock()
 
+# Guards the in-memory state: init_store() runs in a worker thread while the
+# UI thread reads and updates associations. Reentrant because lookups remove
+# stale entries.
+_state_lock = threading.RLock()
+
+# In-memory uid -> Path lookup, built at init and kept in sync on writes.
+# Paths are not checked here; lookups drop entries whose file is gone.
+_association_paths: dict[str, Path] = {}
+
 
 def init_store(data_directory: Path) -> None:
     """Initialize the association store.
@@ -26,8 +35,18 @@ def init_store(data_directory: Path) -> None:
         data_directory: Directory where calendar_associations.json is stored.
     """
     global _store_path, _associations
-    _store_path = data_directory / "calendar_associations.json"
-    _associations = _load()
+    with _state_lock:
+        _store_path = data_directory / "calendar_associations.json"
+        _associations = _load()
+        prefetch_associations()
+
+
+def prefetch_associations() -> None:
+    """Build the uid -> Path lookup from the loaded associations."""
+    with _state_lock:
+        _association_paths.clear()
+        for uid, entry in _associations.items():
+            _association_paths[uid] = Path(entry["file"])
 
 
 def _get_store_path() -> Path:
@@ -69,18 +88,14 @@ def get_association(event_uid: str) -> Path | None:
     Returns:
         Path to the associated file, or None.
     """
-    entry = _associations.get(event_uid)
-    if entry is None:
-        return None
-
-    file_path = Path(entry["file"])
-    if file_path.exists():
-        return file_path
+    with _state_lock:
+        file_path = _association_paths.get(event_uid)
+        if file_path is None or file_path.exists():
+            return file_path
 
-    # File no longer exists — clean up stale association
-    del _associations[event_uid]
-    _save()
-    return None
+        # File was deleted or moved since startup — clean up stale association
+        remove_association(event_uid)
+        return None
 
 
 def set_association(event_uid: str, file_path: Path) -> None:
@@ -90,8 +105,10 @@ def set_association(event_uid: str, file_path: Path) -> None:
         event_uid: The calendar event UID.
         file_path: Path to the note file.
     """
-    _associations[event_uid] = {"file": str(file_path)}
-    _save()
+    with _state_lock:
+        _associations[event_uid] = {"file": str(file_path)}
+        _association_paths[event_uid] = file_path
+        _save()
 
 
 def remove_association(event_uid: str) -> None:
@@ -100,16 +117,31 @@ def remove_association(event_uid: str) -> None:
     Args:
         event_uid: The calendar event UID.
     """
-    if event_uid in _associations:
-        del _associations[event_uid]
+    with _state_lock:
+        if event_uid in _associations:
+            del _associations[event_uid]
+            _association_paths.pop(event_uid, None)
+            _save()
+
+
+def remove_associations_for_file(file_path: Path) -> None:
+    """Remove every association pointing at a file (e.g. after deleting it).
+
+    Args:
+        file_path: Path to the note file.
+    """
+    with _state_lock:
+        stale = [uid for uid, path in _association_paths.items() if path == file_path]
+        if not stale:
+            return
+        for uid in stale:
+            del _associations[uid]
+            del _association_paths[uid]
         _save()
 
 
 def get_all_associations() -> dict[str, Path]:
     """Get all current associations as uid -> Path mapping."""
-    result = {}
-    for uid, entry in _associations.items():
-        path = Path(entry["file"])
-        if path.exists():
-            result[uid] = path
-    return result
+    with _state_lock:
+        paths = list(_association_paths.items())
+    return {uid: path for uid, path in paths if path.exists()}
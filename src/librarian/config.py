@@ -44,7 +44,9 @@ class Config:
 
     scan_directory: Path = field(default_factory=lambda: Path.home() / "Documents")
     editor: str = "vim"
+    editor_is_gui: bool = False
     taskpaper: str = ""
+    watcher_debounce: float = 0.5
     tags: TagConfig = field(default_factory=TagConfig)
     export_directory: Path = field(default_factory=lambda: Path.home() / "Downloads")
     data_directory: Path = field(default_factory=get_default_data_dir)
@@ -80,10 +82,14 @@ class Config:
 
         # Parse editor
         editor = data.get("editor", "vim")
+        editor_is_gui = data.get("editor_is_gui", False)
 
         # Parse taskpaper editor path
         taskpaper = data.get("taskpaper", "")
 
+        # Parse file watcher debounce (seconds)
+        watcher_debounce = float(data.get("watcher_debounce", 0.5))
+
         # Parse tags config
         tags_data = data.get("tags", {})
         tags = TagConfig(
@@ -110,7 +116,9 @@ class Config:
         config = cls(
             scan_directory=scan_directory,
             editor=editor,
+            editor_is_gui=editor_is_gui,
             taskpaper=taskpaper,
+            watcher_debounce=watcher_debounce,
             tags=tags,
             export_directory=export_directory,
             data_directory=data_directory,
@@ -137,10 +145,16 @@ class Config:
             '# Editor command for editing files',
             f'editor = "{self.editor}"',
             '',
+            '# Set to true for GUI editors (e.g. "code") so the TUI keeps running',
+            f'editor_is_gui = {str(self.editor_is_gui).lower()}',
+            '',
             '# TaskPaper TUI executable for editing .taskpaper files',
             '# e.g. taskpaper = "taskpapertui"',
             f'taskpaper = "{self.taskpaper}"',
             '',
+            '# Seconds to wait for file changes to settle before reindexing',
+            f'watcher_debounce = {self.watcher_debounce}',
+            '',
             '# Directory for exported files (PDF/HTML)',
             f'export_directory = "{self.export_directory}"',
             '',
@@ -4,7 +4,7 @@ import json
 import logging
 import os
 import threading
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Generator, TypedDict
@@ -34,6 +34,27 @@ _batch_dirty: bool = False
 # Thread lock for index writes to prevent concurrent corruption
 _write_lock = threading.Lock()
 
+# Bumped on every index mutation so cached query results can be invalidated
+_generation: int = 0
+
+# Last get_tag_snapshot() result and the generation it was built at
+_tag_snapshot: tuple[int, tuple[list[tuple[str, int]], dict[str, list[Path]]]] | None = None
+
+# Resolved wiki links keyed by (target, current directory, scan directory),
+# oldest first. Only hits are cached; cleared by _mark_changed(), which may
+# run on the scan or watcher thread, hence the lock.
+_WIKI_LINK_CACHE_SIZE = 1024
+_wiki_link_cache: OrderedDict[tuple[str, Path | None, Path | None], Path] = OrderedDict()
+_wiki_link_lock = threading.Lock()
+
+
+def _mark_changed() -> None:
+    """Invalidate cached query results after the index changed."""
+    global _generation
+    _generation += 1
+    with _wiki_link_lock:
+        _wiki_link_cache.clear()
+
 
 def _get_index_path() -> Path:
     """Get the configured index path."""
@@ -75,12 +96,23 @@ def _save_index() -> None:
         _batch_dirty = True
         return
 
+    _write_index_to_disk()
+
+
+def _write_index_to_disk() -> None:
+    """Atomically write the index to disk (temp file + rename).
+
+    Written as compact JSON: the index is only read back by json.load, and
+    skipping indentation makes large indexes markedly faster to serialize
+    and smaller on disk (and in iCloud sync).
+    """
     with _write_lock:
         index_path = _get_index_path()
         index_path.parent.mkdir(parents=True, exist_ok=True)
 
         temp_path = index_path.with_suffix(".json.tmp")
-        temp_path.write_text(json.dumps({"files": _index}, indent=2))
+        with open(temp_path, "w") as f:
+            json.dump({"files": _index}, f, separators=(",", ":"))
         os.replace(temp_path, index_path)
 
 
@@ -100,13 +132,7 @@ def batch_writes() -> Generator[None, None, None]:
         _batch_mode = False
         if _batch_dirty:
             _batch_dirty = False
-            # Force save now with lock protection
-            with _write_lock:
-                index_path = _get_index_path()
-                index_path.parent.mkdir(parents=True, exist_ok=True)
-                temp_path = index_path.with_suffix(".json.tmp")
-                temp_path.write_text(json.dumps({"files": _index}, indent=2))
-                os.replace(temp_path, index_path)
+            _write_index_to_disk()
 
 
 def init_database(index_path: Path) -> None:
@@ -119,6 +145,7 @@ def init_database(index_path: Path) -> None:
     _index_path = index_path
     _index_loaded = False
     _index = {}
+    _mark_changed()
     logger.info("Database initialized (lazy): %s", index_path)
 
 
@@ -126,6 +153,7 @@ def add_file(path: Path, mtime: float, tags: list[str]) -> None:
     """Add or update a file with its tags."""
     _ensure_loaded()
     _index[str(path)] = {"mtime": mtime, "tags": tags}
+    _mark_changed()
     _save_index()
 
 
@@ -135,9 +163,25 @@ def remove_file(path: Path) -> None:
     path_str = str(path)
     if path_str in _index:
         del _index[path_str]
+        _mark_changed()
         _save_index()
 
 
+def rename_file(old_path: Path, new_path: Path) -> bool:
+    """Move an index entry to a new path, keeping its mtime and tags.
+
+    Returns False (and changes nothing) if old_path is not indexed.
+    """
+    _ensure_loaded()
+    entry = _index.pop(str(old_path), None)
+    if entry is None:
+        return False
+    _index[str(new_path)] = entry
+    _mark_changed()
+    _save_index()
+    return True
+
+
 def get_file_mtime(path: Path) -> float | None:
     """Get the stored mtime for a file, or None if not indexed."""
     _ensure_loaded()
@@ -145,6 +189,13 @@ def get_file_mtime(path: Path) -> float | None:
     return entry["mtime"] if entry else None
 
 
+def get_file_tags(path: Path) -> list[str]:
+    """Get the stored tags for a file, or an empty list if not indexed."""
+    _ensure_loaded()
+    entry = _index.get(str(path))
+    return list(entry["tags"]) if entry else []
+
+
 def get_all_tags() -> list[tuple[str, int]]:
     """Get all tags with their file counts, sorted by count descending."""
     _ensure_loaded()
@@ -172,17 +223,100 @@ def get_files_by_tag(tag_name: str) -> list[tuple[Path, float]]:
     return result
 
 
+def get_generation() -> int:
+    """Get a counter that changes whenever the index is modified."""
+    return _generation
+
+
+def get_file_paths_by_tag(tag_name: str) -> list[Path]:
+    """Get the paths of all files with a specific tag, most recent first.
+
+    Served from the tag snapshot while it is current; callers must not
+    mutate the returned list.
+    """
+    _ensure_loaded()
+
+    # A current tag snapshot already maps every tag to its files
+    snapshot = _tag_snapshot
+    if snapshot is not None and snapshot[0] == _generation:
+        return snapshot[1][1].get(tag_name, [])
+
+    # Iterate a copy: scan and watcher threads may update the index meanwhile
+    matches = [
+        (entry["mtime"], path_str)
+        for path_str, entry in tuple(_index.items())
+        if tag_name in entry["tags"]
+    ]
+    matches.sort(key=lambda m: m[0], reverse=True)
+    return [Path(path_str) for _, path_str in matches]
+
+
+def get_tag_snapshot() -> tuple[list[tuple[str, int]], dict[str, list[Path]]]:
+    """Get every tag's file count and files from one pass over the index.
+
+    Equivalent to get_all_tags() followed by get_file_paths_by_tag() for
+    every tag, but walks a single copy of the index, so the counts and file
+    lists always agree even if another thread updates the index meanwhile.
+
+    The result is reused until the index next changes; callers must not
+    mutate it.
+    """
+    global _tag_snapshot
+    _ensure_loaded()
+    generation = _generation
+    if _tag_snapshot is not None and _tag_snapshot[0] == generation:
+        return _tag_snapshot[1]
+
+    matches: dict[str, list[tuple[float, str]]] = defaultdict(list)
+    for path_str, entry in tuple(_index.items()):
+        mtime = entry["mtime"]
+        for tag in entry["tags"]:
+            matches[tag].append((mtime, path_str))
+
+    # Sort by count descending, then name ascending, as get_all_tags() does
+    tags = sorted(
+        ((tag, len(bucket)) for tag, bucket in matches.items()),
+        key=lambda x: (-x[1], x[0]),
+    )
+    snapshot = (tags, _sorted_tag_paths(matches))
+    _tag_snapshot = (generation, snapshot)
+    return snapshot
+
+
+def _sorted_tag_paths(
+    matches: dict[str, list[tuple[float, str]]],
+) -> dict[str, list[Path]]:
+    """Turn per-tag (mtime, path) buckets into path lists, most recent first."""
+    # Share one Path object per file across all tag lists
+    paths: dict[str, Path] = {}
+    result: dict[str, list[Path]] = {}
+    for tag, bucket in matches.items():
+        bucket.sort(key=lambda m: m[0], reverse=True)
+        result[tag] = [
+            paths.get(path_str) or paths.setdefault(path_str, Path(path_str))
+            for _, path_str in bucket
+        ]
+    return result
+
+
 def get_all_files() -> list[Path]:
     """Get all indexed file paths."""
     _ensure_loaded()
     return sorted(Path(p) for p in _index.keys())
 
 
+def get_all_mtimes() -> dict[str, float]:
+    """Get the stored mtime of every indexed file, keyed by path string."""
+    _ensure_loaded()
+    return {path_str: entry["mtime"] for path_str, entry in _index.items()}
+
+
 def clear_index() -> None:
     """Clear all indexed data."""
     global _index, _index_loaded
     _index = {}
     _index_loaded = True  # Mark as loaded (empty)
+    _mark_changed()
     _save_index()
 
 
@@ -254,6 +388,38 @@ def resolve_wiki_link(
     # Normalize target - remove leading/trailing whitespace
     target = target.strip()
 
+    # Repeat clicks on a link are served from the cache while the file exists
+    key = (
+        target,
+        current_file.parent if current_file is not None else None,
+        scan_directory,
+    )
+    with _wiki_link_lock:
+        cached = _wiki_link_cache.get(key)
+        if cached is not None:
+            _wiki_link_cache.move_to_end(key)
+    if cached is not None:
+        if cached.exists():
+            return cached
+        with _wiki_link_lock:
+            _wiki_link_cache.pop(key, None)
+
+    resolved = _resolve_wiki_link_uncached(target, current_file, scan_directory)
+    if resolved is not None:
+        with _wiki_link_lock:
+            _wiki_link_cache[key] = resolved
+            if len(_wiki_link_cache) > _WIKI_LINK_CACHE_SIZE:
+                _wiki_link_cache.popitem(last=False)
+    return resolved
+
+
+def _resolve_wiki_link_uncached(
+    target: str,
+    current_file: Path | None,
+    scan_directory: Path | None,
+) -> Path | None:
+    """Resolve a normalized wiki link target without consulting the cache."""
+
     # Reject targets with path traversal patterns
     if ".." in target:
         return None
@@ -1,8 +1,13 @@
 """File scanning and tag extraction for markdown files."""
 
 import logging
+import multiprocessing
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
+from typing import Callable, Iterator
 
 logger = logging.getLogger(__name__)
 
@@ -10,10 +15,10 @@ from .config import Config
 from .database import (
     add_file,
     batch_writes,
-    get_all_files,
+    get_all_mtimes,
     get_file_mtime,
-    init_database,
     remove_file,
+    rename_file,
     cleanup_orphaned_tags,
 )
 
@@ -35,99 +40,199 @@ def extract_tags(content: str) -> list[str]:
     return unique_tags
 
 
-def scan_file(path: Path, config: Config) -> list[str]:
-    """Scan a single file and extract tags, applying whitelist if configured."""
+def _read_tags(path_str: str) -> list[str]:
+    """Read a file and extract its tags (top-level so worker processes can run it)."""
     try:
-        content = path.read_text(encoding="utf-8")
+        with open(path_str, encoding="utf-8") as f:
+            content = f.read()
     except (OSError, UnicodeDecodeError):
         return []
+    return extract_tags(content)
 
-    tags = extract_tags(content)
 
-    # Apply whitelist filtering if configured
+def _apply_whitelist(tags: list[str], config: Config) -> list[str]:
+    """Filter tags down to the configured whitelist, if whitelist mode is on."""
     if config.tags.mode == "whitelist" and config.tags.whitelist:
         whitelist_lower = {t.lower() for t in config.tags.whitelist}
         tags = [t for t in tags if t.lower() in whitelist_lower]
-
     return tags
 
 
+def scan_file(path: Path, config: Config) -> list[str]:
+    """Scan a single file and extract tags, applying whitelist if configured."""
+    return _apply_whitelist(_read_tags(str(path)), config)
+
+
+# Reading at least this many files in one scan is worth the cost of
+# starting worker processes
+PARALLEL_SCAN_THRESHOLD = 500
+
+# Each spawned worker re-imports librarian; more than a few of them cost
+# more to start than they save on a scan of a few thousand files
+MAX_SCAN_WORKERS = 4
+
+
+def prepare_parallel_scan() -> None:
+    """Start multiprocessing's resource tracker while stderr is still a real file.
+
+    The scan process pool needs the tracker, and launching it passes on
+    sys.stderr's file descriptor. Once a Textual app is running, sys.stderr
+    is a capture object whose fileno() is -1 and the launch fails, so call
+    this before App.run().
+    """
+    if os.name != "posix":
+        return
+    from multiprocessing import resource_tracker
+
+    try:
+        resource_tracker.ensure_running()
+    except (OSError, ValueError) as e:
+        logger.warning("Could not start resource tracker: %s", e)
+
+
+# Report scan progress after applying this many files
+PROGRESS_INTERVAL = 500
+
+
+def _iter_read_tags(path_strs: list[str]) -> Iterator[list[str]]:
+    """Extract tags from many files, yielding each file's tags in order.
+
+    Tag extraction is Python-level work that holds the GIL, so a large
+    initial scan in a thread starves the UI. Big batches are spread over a
+    process pool instead; small ones (and platforms where a pool cannot be
+    started) are read in-process. Results are yielded as they arrive, so
+    the caller can apply them while later files are still being read.
+    """
+    done = 0
+    if len(path_strs) >= PARALLEL_SCAN_THRESHOLD:
+        try:
+            context = multiprocessing.get_context("spawn")
+            workers = min(os.cpu_count() or 1, MAX_SCAN_WORKERS)
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+                for tags in pool.map(_read_tags, path_strs, chunksize=64):
+                    yield tags
+                    done += 1
+            return
+        except (OSError, ValueError, BrokenProcessPool) as e:
+            logger.warning("Parallel scan unavailable, reading in-process: %s", e)
+    for path_str in path_strs[done:]:
+        yield _read_tags(path_str)
+
+
 SUPPORTED_EXTENSIONS = {".md", ".taskpaper"}
 
 
+def _iter_scannable_files(directory: str) -> Iterator[tuple[str, float]]:
+    """Walk a directory with os.scandir, yielding (path, mtime) for supported files.
+
+    Unreadable directories and files that vanish mid-walk are skipped.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            subdirs = []
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif (
+                        os.path.splitext(entry.name)[1].lower() in SUPPORTED_EXTENSIONS
+                        and entry.is_file()
+                    ):
+                        yield entry.path, entry.stat().st_mtime
+                except OSError:
+                    continue
+    except OSError:
+        return
+
+    for subdir in subdirs:
+        yield from _iter_scannable_files(subdir)
+
+
 def find_scannable_files(directory: Path) -> list[Path]:
     """Recursively find all supported files (.md, .taskpaper) in a directory."""
     if not directory.exists():
         return []
-
-    files = []
-    try:
-        for path in directory.rglob("*"):
-            if path.is_file() and path.suffix.lower() in SUPPORTED_EXTENSIONS:
-                files.append(path)
-    except PermissionError:
-        pass
-
-    return files
+    return [Path(path_str) for path_str, _ in _iter_scannable_files(str(directory))]
 
 
-def scan_directory(config: Config, full_rescan: bool = False) -> tuple[int, int, int]:
+def scan_directory(
+    config: Config,
+    full_rescan: bool = False,
+    on_progress: Callable[[], None] | None = None,
+) -> tuple[int, int, int]:
     """
     Scan the configured directory for markdown files and update the index.
 
+    Stored mtimes are fetched once up front and compared against the
+    mtimes reported while walking, so only new or changed files are read.
+    The index must already be initialized; its in-memory copy is reused
+    rather than reloaded from disk.
+
     Args:
         config: Application configuration
         full_rescan: If True, rescan all files regardless of mtime
+        on_progress: Called from the scanning thread after every
+            PROGRESS_INTERVAL files read, if the in-memory index changed
+            since the last call, so callers can show partial results
 
     Returns:
         Tuple of (added, updated, removed) file counts
     """
-    init_database(config.get_index_path())
-
     scan_dir = config.scan_directory
     logger.info("Scanning directory: %s (full_rescan=%s)", scan_dir, full_rescan)
-    scannable_files = find_scannable_files(scan_dir)
-    logger.debug("Found %d scannable files", len(scannable_files))
-
-    # Track current file paths
-    current_paths = {str(p) for p in scannable_files}
+    current_mtimes = (
+        dict(_iter_scannable_files(str(scan_dir))) if scan_dir.exists() else {}
+    )
+    logger.debug("Found %d scannable files", len(current_mtimes))
 
-    # Get previously indexed files
-    indexed_files = get_all_files()
-    indexed_paths = {str(p) for p in indexed_files}
+    # Previously indexed files and their stored mtimes
+    known_mtimes = get_all_mtimes()
 
     added = 0
     updated = 0
     removed = 0
 
+    # Files whose tags need (re)reading: new ones, and changed ones
+    to_read = [
+        path_str
+        for path_str, mtime in current_mtimes.items()
+        if path_str not in known_mtimes or full_rescan or known_mtimes[path_str] != mtime
+    ]
+
     # Batch all writes to save only once at the end
     with batch_writes():
         # Remove files that no longer exist
-        for path in indexed_files:
-            if str(path) not in current_paths:
-                remove_file(path)
+        for path_str in known_mtimes:
+            if path_str not in current_mtimes:
+                remove_file(Path(path_str))
                 removed += 1
 
         # Add or update files
-        for path in scannable_files:
-            mtime = path.stat().st_mtime
-
-            if str(path) not in indexed_paths:
+        reported_changes = 0
+        for count, (path_str, tags) in enumerate(
+            zip(to_read, _iter_read_tags(to_read)), start=1
+        ):
+            path = Path(path_str)
+            tags = _apply_whitelist(tags, config)
+            if path_str not in known_mtimes:
                 # New file
-                tags = scan_file(path, config)
                 if tags:  # Only index files with tags
-                    add_file(path, mtime, tags)
+                    add_file(path, current_mtimes[path_str], tags)
                     added += 1
-            elif full_rescan or get_file_mtime(path) != mtime:
+            elif tags:
                 # Modified file
-                tags = scan_file(path, config)
-                if tags:
-                    add_file(path, mtime, tags)
-                    updated += 1
-                else:
-                    # File no longer has tags, remove it
-                    remove_file(path)
-                    removed += 1
+                add_file(path, current_mtimes[path_str], tags)
+                updated += 1
+            else:
+                # File no longer has tags, remove it
+                remove_file(path)
+                removed += 1
+
+            if on_progress is not None and count % PROGRESS_INTERVAL == 0:
+                changes = added + updated + removed
+                if changes != reported_changes:
+                    reported_changes = changes
+                    on_progress()
 
     # Clean up orphaned tags
     cleanup_orphaned_tags()
@@ -157,3 +262,28 @@ def rescan_file(path: Path, config: Config) -> bool:
         remove_file(path)
         cleanup_orphaned_tags()
         return False
+
+
+def rescan_moved_file(old_path: Path, new_path: Path, config: Config) -> bool:
+    """
+    Update the index after a file was renamed or moved.
+
+    A rename keeps the file's mtime, so if it still matches the stored one
+    the entry is moved as-is without rereading the file. Otherwise the old
+    entry is dropped and the new path rescanned inside a single batch, so
+    the index is written to disk once instead of twice.
+
+    Returns True if the new path was indexed (has tags), False otherwise.
+    """
+    stored_mtime = get_file_mtime(old_path)
+    if stored_mtime is not None:
+        try:
+            unchanged = new_path.stat().st_mtime == stored_mtime
+        except OSError:
+            unchanged = False
+        if unchanged and rename_file(old_path, new_path):
+            return True
+
+    with batch_writes():
+        remove_file(old_path)
+        return rescan_file(new_path, config)
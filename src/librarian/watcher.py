@@ -8,14 +8,27 @@ from typing import Callable
 
 logger = logging.getLogger(__name__)
 
-from watchdog.events import FileSystemEventHandler, FileSystemEvent
+from watchdog.events import (
+    FileCreatedEvent,
+    FileDeletedEvent,
+    FileModifiedEvent,
+    FileMovedEvent,
+    FileSystemEvent,
+    FileSystemEventHandler,
+)
 from watchdog.observers import Observer
 
 from .config import Config
-from .database import batch_writes
+from .database import batch_writes, get_file_tags
 from .scanner import rescan_file
 from .widgets.preview import invalidate_file_cache
 
+# The only events MarkdownEventHandler acts on. Passing them as the watch's
+# event_filter lets the observer drop the rest (opens, no-write closes,
+# directory events) at the source; on Linux they are left out of the inotify
+# mask, so the scanner and preview reading files wake nothing up.
+WATCHED_EVENTS = [FileCreatedEvent, FileModifiedEvent, FileDeletedEvent, FileMovedEvent]
+
 
 class MarkdownEventHandler(FileSystemEventHandler):
     """Handler for markdown file changes with debouncing."""
@@ -23,7 +36,7 @@ class MarkdownEventHandler(FileSystemEventHandler):
     def __init__(
         self,
         config: Config,
-        on_change: Callable[[], None],
+        on_change: Callable[[set[str]], None],
         debounce_seconds: float = 0.5,
     ):
         super().__init__()
@@ -67,16 +80,20 @@ class MarkdownEventHandler(FileSystemEventHandler):
             return
 
         logger.info("Processing %d file change(s)", len(paths))
+        # Tags whose file lists may have changed: each file's tags before and after
+        affected_tags: set[str] = set()
         # Process all changed files in a single batch to minimize disk I/O
         with batch_writes():
             for path_str in paths:
                 path = Path(path_str)
                 # Invalidate preview cache for this file
                 invalidate_file_cache(path)
+                affected_tags.update(get_file_tags(path))
                 rescan_file(path, self.config)
+                affected_tags.update(get_file_tags(path))
 
         # Notify of changes
-        self.on_change()
+        self.on_change(affected_tags)
 
     def on_created(self, event: FileSystemEvent) -> None:
         """Handle file creation."""
@@ -110,7 +127,7 @@ class FileWatcher:
     def __init__(
         self,
         config: Config,
-        on_change: Callable[[], None],
+        on_change: Callable[[set[str]], None],
     ):
         self.config = config
         self.on_change = on_change
@@ -125,6 +142,7 @@ class FileWatcher:
         self._handler = MarkdownEventHandler(
             self.config,
             self.on_change,
+            debounce_seconds=self.config.watcher_debounce,
         )
 
         self._observer = Observer()
@@ -132,6 +150,7 @@ class FileWatcher:
             self._handler,
             str(self.config.scan_directory),
             recursive=True,
+            event_filter=WATCHED_EVENTS,
         )
         self._observer.daemon = True
         self._observer.start()
@@ -3,7 +3,7 @@
 from .banner import Banner
 from .tag_list import TagList
 from .file_list import FileList
-from .preview import Preview, load_file_content
+from .preview import Preview, get_cached_content, load_file_content
 from .file_info import RenameModal, MoveModal, AssociateModal, FileInfoModal
 from .calendar_list import CalendarList
 from .protocols import (
@@ -18,6 +18,7 @@ __all__ = [
     "TagList",
     "FileList",
     "Preview",
+    "get_cached_content",
     "load_file_content",
     "RenameModal",
     "MoveModal",
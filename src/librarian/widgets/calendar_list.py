@@ -1,5 +1,6 @@
 """Calendar list widget for displaying today's meetings."""
 
+from functools import cached_property
 from pathlib import Path
 
 from textual.app import ComposeResult
@@ -84,16 +85,23 @@ class CalendarList(Vertical):
         yield ListView(id="calendar-list-view")
         yield Static("", id="calendar-status")
 
-    @property
+    @cached_property
     def list_view(self) -> ListView:
         return self.query_one("#calendar-list-view", ListView)
 
-    @property
+    @cached_property
     def status_label(self) -> Static:
         return self.query_one("#calendar-status", Static)
 
     def update_events(self, events: list[CalendarEvent]) -> None:
         """Update the meeting list with new events."""
+        if events and events == self._events:
+            # Already showing these meetings: keep the cursor in place, but
+            # re-announce it so the preview follows the highlighted meeting
+            selected = self.get_selected_event()
+            if selected is not None:
+                self.post_message(self.MeetingSelected(selected))
+            return
         self._events = events
         list_view = self.list_view
 
@@ -1,5 +1,6 @@
 """File list widget for displaying files with a selected tag."""
 
+from functools import cached_property
 from pathlib import Path
 
 from textual.app import ComposeResult
@@ -11,6 +12,13 @@ from textual.widgets import Input, Label, ListItem, ListView, Static
 # Maximum files to display before showing "Show more" item
 MAX_DISPLAY_FILES = 500
 
+# Most files refresh_files() will insert at the top before rebuilding instead
+MAX_FRONT_CHANGES = 8
+
+# ListView.insert()/remove_items() only exist in newer Textual releases;
+# without them refresh_files() always rebuilds the list
+_CAN_EDIT_IN_PLACE = hasattr(ListView, "insert") and hasattr(ListView, "remove_items")
+
 
 class FileItem(ListItem):
     """A list item representing a file."""
@@ -113,6 +121,7 @@ class FileList(Vertical):
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
         self._files: list[Path] = []
+        self._files_set: set[Path] = set()  # Membership index for _files
         self._all_files: list[Path] = []  # Full list before truncation
         self._current_tag: str | None = None
         self._navigation_target: str | None = None
@@ -125,10 +134,26 @@ class FileList(Vertical):
         yield Input(placeholder="Search files and tags...", id="search-input")
         yield ListView(id="file-list-view")
 
-    @property
+    @cached_property
     def list_view(self) -> ListView:
         return self.query_one("#file-list-view", ListView)
 
+    @cached_property
+    def header(self) -> Static:
+        return self.query_one("#file-header", Static)
+
+    def _set_files(self, files: list[Path]) -> None:
+        """Set the displayed files, keeping the membership index in sync.
+
+        The list is stored as given and must not be mutated afterwards.
+        """
+        self._files = files
+        self._files_set = set(files)
+
+    def contains(self, file_path: Path) -> bool:
+        """Check whether a file is currently displayed in the list."""
+        return file_path in self._files_set
+
     def update_files(
         self,
         files: list[Path],
@@ -157,7 +182,7 @@ class FileList(Vertical):
         search_input.value = ""
 
         # Update header
-        header = self.query_one("#file-header", Static)
+        header = self.header
         if navigation_target:
             header.update(f"FILES (-> {navigation_target})")
         elif tag:
@@ -171,7 +196,7 @@ class FileList(Vertical):
         else:
             display_files = files
 
-        self._files = display_files
+        self._set_files(display_files)
 
         for file_path in display_files:
             list_view.append(FileItem(file_path))
@@ -202,7 +227,7 @@ class FileList(Vertical):
     def _show_all_files(self) -> None:
         """Expand the file list to show all files."""
         self._files_show_all = True
-        self._files = self._all_files
+        self._set_files(self._all_files)
         list_view = self.list_view
         list_view.clear()
         for file_path in self._all_files:
@@ -210,6 +235,94 @@ class FileList(Vertical):
         if self._all_files:
             list_view.index = 0
 
+    async def refresh_files(self, files: list[Path], tag: str | None) -> None:
+        """Show an updated file list for the current tag, changing only what differs.
+
+        The list is ordered most recent first, so index changes usually drop
+        some files and bring a few new or just-edited ones to the top. Those
+        are applied to the existing items and the cursor stays on the same
+        file. Anything else, such as a different tag or a truncated list,
+        falls back to update_files(), as does a Textual release without
+        ListView.insert()/remove_items().
+        """
+        front = self._front_changes(files, tag)
+        if front is None:
+            self.update_files(files, tag)
+            return
+
+        list_view = self.list_view
+        selected = self.get_selected_file()
+        old_index = list_view.index or 0
+        keep = set(files).difference(front)
+        # Clear the cursor while items move so no stale item stays highlighted
+        list_view.index = None
+        stale = [i for i, file_path in enumerate(self._files) if file_path not in keep]
+        self._all_files = files
+        self._set_files(files)
+        if stale:
+            await list_view.remove_items(stale)
+        if front:
+            await list_view.insert(0, [FileItem(file_path) for file_path in front])
+
+        if files:
+            if selected in self._files_set:
+                list_view.index = files.index(selected)
+            else:
+                list_view.index = min(old_index, len(files) - 1)
+
+    def _front_changes(self, files: list[Path], tag: str | None) -> list[Path] | None:
+        """Get the files refresh_files() must insert at the top, or None to rebuild.
+
+        Returns the shortest prefix of files such that the rest is the current
+        list, in order, minus files that were removed or moved to that prefix.
+        """
+        if (
+            not _CAN_EDIT_IN_PLACE
+            or self._search_mode
+            or self._navigation_target is not None
+            or self._current_tag != tag
+        ):
+            return None
+        if not self._files_show_all and (
+            len(files) > MAX_DISPLAY_FILES or len(self._all_files) > MAX_DISPLAY_FILES
+        ):
+            return None
+
+        new_set = set(files)
+        remaining = [file_path for file_path in self._files if file_path in new_set]
+        for count in range(min(len(files), MAX_FRONT_CHANGES) + 1):
+            front = files[:count]
+            front_set = set(front)
+            rest = [file_path for file_path in remaining if file_path not in front_set]
+            if rest == files[count:]:
+                return front
+        return None
+
+    def activate(self) -> None:
+        """Focus the list and highlight the item under the cursor.
+
+        clear() removes old items asynchronously, so an index set while the
+        list is repopulated highlights (and reports) whichever item was at
+        that position before the removal finished. Call this after the next
+        refresh to highlight the right item without moving the cursor.
+        """
+        list_view = self.list_view
+        list_view.focus()
+        index = list_view.index
+        for item in list_view.children:
+            item.highlighted = False
+        list_view.index = None
+        list_view.index = index
+
+    def is_showing(self, files: list[Path], tag: str | None) -> bool:
+        """Check whether the list already displays exactly these files for a tag."""
+        return (
+            not self._search_mode
+            and self._navigation_target is None
+            and self._current_tag == tag
+            and self._all_files == files
+        )
+
     def get_selected_file(self) -> Path | None:
         """Get the currently highlighted file path."""
         list_view = self.list_view
@@ -222,12 +335,15 @@ class FileList(Vertical):
     def get_navigation_info(self) -> tuple[str | None, list[Path], int]:
         """Get current navigation info for state saving.
 
+        The files list is returned without copying: _files is only ever
+        rebound to a new list, never mutated, so it is a stable snapshot.
+
         Returns:
             Tuple of (current_tag, files, selected_index)
         """
         list_view = self.list_view
         index = list_view.index if list_view.index is not None else 0
-        return (self._current_tag, self._files.copy(), index)
+        return (self._current_tag, self._files, index)
 
     def is_navigation_mode(self) -> bool:
         """Check if currently in wiki link navigation mode."""
@@ -258,7 +374,8 @@ class FileList(Vertical):
             selected_index: Index to highlight
             header_text: Header text to restore
         """
-        self._files = files
+        self._set_files(files)
+        self._all_files = files
         self._current_tag = tag
         self._navigation_target = None
         self._match_info = {}
@@ -266,7 +383,7 @@ class FileList(Vertical):
         list_view.clear()
 
         # Restore header
-        header = self.query_one("#file-header", Static)
+        header = self.header
         header.update(header_text)
 
         for file_path in files:
@@ -277,7 +394,7 @@ class FileList(Vertical):
             list_view.index = selected_index
             self.post_message(self.FileHighlighted(files[selected_index]))
 
-    @property
+    @cached_property
     def search_input(self) -> Input:
         return self.query_one("#search-input", Input)
 
@@ -294,11 +411,11 @@ class FileList(Vertical):
         search_input.focus()
 
         # Update header
-        header = self.query_one("#file-header", Static)
+        header = self.header
         header.update("SEARCH")
 
         # Clear list while waiting for input
-        self._files = []
+        self._set_files([])
         self._match_info = {}
         self.list_view.clear()
 
@@ -310,12 +427,12 @@ class FileList(Vertical):
         search_input.value = ""
 
         # Clear search results
-        self._files = []
+        self._set_files([])
         self._match_info = {}
         self.list_view.clear()
 
         # Reset header
-        header = self.query_one("#file-header", Static)
+        header = self.header
         header.update("FILES")
 
         # Notify app that search mode exited
@@ -329,7 +446,7 @@ class FileList(Vertical):
         Args:
             results: List of (path, mtime, matching_tags) tuples
         """
-        self._files = [r[0] for r in results]
+        self._set_files([r[0] for r in results])
         self._match_info = {}
         self._current_tag = None
         self._navigation_target = None
@@ -338,7 +455,7 @@ class FileList(Vertical):
         list_view.clear()
 
         # Update header with result count
-        header = self.query_one("#file-header", Static)
+        header = self.header
         header.update(f"SEARCH ({len(results)} results)")
 
         for path, mtime, matching_tags in results:
@@ -369,10 +486,10 @@ class FileList(Vertical):
                 self.update_search_results(results)
             else:
                 # Clear results when query is empty
-                self._files = []
+                self._set_files([])
                 self._match_info = {}
                 self.list_view.clear()
-                header = self.query_one("#file-header", Static)
+                header = self.header
                 header.update("SEARCH")
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
@@ -1,6 +1,9 @@
 """Markdown preview widget."""
 
+import codecs
+import os
 from collections import OrderedDict
+from functools import cached_property
 from pathlib import Path
 
 from textual.app import ComposeResult
@@ -11,12 +14,20 @@ from textual.widgets import Markdown, Static
 from ..taskpaper import taskpaper_to_markdown
 from ..wikilink import extract_wiki_target, is_wiki_link, preprocess_wiki_links
 
+# Only this much of a file is read and rendered in the preview
+PREVIEW_MAX_BYTES = 256 * 1024
+TRUNCATED_MARKER = "\n\n*…truncated; press e to view full file*"
+
 
 class FileCache:
-    """LRU cache for file contents with mtime-based invalidation."""
+    """LRU cache for processed preview content with stat-based invalidation.
+
+    Entries are validated against the file's (st_mtime_ns, st_size), so a
+    hit skips both the read and the wiki-link/taskpaper preprocessing.
+    """
 
-    def __init__(self, max_size: int = 10) -> None:
-        self._cache: OrderedDict[str, tuple[float, str]] = OrderedDict()
+    def __init__(self, max_size: int = 64) -> None:
+        self._cache: OrderedDict[str, tuple[int, int, str]] = OrderedDict()
         self._max_size = max_size
 
     def get(self, path: Path) -> str | None:
@@ -25,12 +36,12 @@ class FileCache:
         if key not in self._cache:
             return None
 
-        cached_mtime, content = self._cache[key]
+        cached_mtime, cached_size, content = self._cache[key]
 
         # Check if file has been modified
         try:
-            current_mtime = path.stat().st_mtime
-            if current_mtime != cached_mtime:
+            stat = path.stat()
+            if stat.st_mtime_ns != cached_mtime or stat.st_size != cached_size:
                 # File changed, invalidate cache
                 del self._cache[key]
                 return None
@@ -43,15 +54,15 @@ class FileCache:
         self._cache.move_to_end(key)
         return content
 
-    def put(self, path: Path, mtime: float, content: str) -> None:
-        """Cache file content."""
+    def put(self, path: Path, mtime_ns: int, size: int, content: str) -> None:
+        """Cache processed file content."""
         key = str(path)
 
         # Remove oldest entry if at capacity
         if len(self._cache) >= self._max_size and key not in self._cache:
             self._cache.popitem(last=False)
 
-        self._cache[key] = (mtime, content)
+        self._cache[key] = (mtime_ns, size, content)
         self._cache.move_to_end(key)
 
     def invalidate(self, path: Path) -> None:
@@ -62,7 +73,7 @@ class FileCache:
 
 
 # Shared cache instance
-_file_cache = FileCache(max_size=10)
+_file_cache = FileCache(max_size=64)
 
 
 def invalidate_file_cache(path: Path) -> None:
@@ -70,10 +81,21 @@ def invalidate_file_cache(path: Path) -> None:
     _file_cache.invalidate(path)
 
 
+def get_cached_content(file_path: Path) -> str | None:
+    """Get processed preview content if it is cached and still current.
+
+    Only costs a stat, so it is cheap enough to call on the main thread
+    before deciding whether a worker load is needed.
+    """
+    return _file_cache.get(file_path)
+
+
 def load_file_content(file_path: Path) -> tuple[str | None, str | None]:
     """Load file content for preview (can be called from worker thread).
 
     Handles cache lookup, file reading, and wiki link preprocessing.
+    Only the first PREVIEW_MAX_BYTES of the file are read; longer files
+    end with a truncation marker.
 
     Args:
         file_path: Path to the markdown file to load
@@ -83,30 +105,31 @@ def load_file_content(file_path: Path) -> tuple[str | None, str | None]:
         If successful, error_message is None.
         If failed, processed_content is None and error_message contains the error.
     """
-    is_taskpaper = file_path.suffix.lower() == ".taskpaper"
-
-    # Try to get from cache first (includes mtime check via stat)
-    content = _file_cache.get(file_path)
-    if content is not None:
-        if is_taskpaper:
-            processed_content = taskpaper_to_markdown(content)
-        else:
-            processed_content = preprocess_wiki_links(content)
+    # Try to get from cache first (includes mtime/size check via stat)
+    processed_content = _file_cache.get(file_path)
+    if processed_content is not None:
         return (processed_content, None)
 
-    # Read from disk and cache
+    # Read from disk, process and cache
     try:
-        mtime = file_path.stat().st_mtime
-        content = file_path.read_text(encoding="utf-8")
-        _file_cache.put(file_path, mtime, content)
-        if is_taskpaper:
-            processed_content = taskpaper_to_markdown(content)
-        else:
-            processed_content = preprocess_wiki_links(content)
-        return (processed_content, None)
+        with open(file_path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            data = f.read(PREVIEW_MAX_BYTES)
+            truncated = len(data) == PREVIEW_MAX_BYTES and f.read(1) != b""
+        # Not final when truncated, so a character split by the cap is dropped
+        content = codecs.getincrementaldecoder("utf-8")().decode(data, final=not truncated)
     except (OSError, UnicodeDecodeError) as e:
         return (None, f"*Error reading file: {e}*")
 
+    if file_path.suffix.lower() == ".taskpaper":
+        processed_content = taskpaper_to_markdown(content)
+    else:
+        processed_content = preprocess_wiki_links(content)
+    if truncated:
+        processed_content += TRUNCATED_MARKER
+    _file_cache.put(file_path, stat.st_mtime_ns, stat.st_size, processed_content)
+    return (processed_content, None)
+
 
 class Preview(Vertical):
     """Widget displaying a markdown file preview."""
@@ -149,17 +172,28 @@ class Preview(Vertical):
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
         self._current_file: Path | None = None
+        self._header_text = "PREVIEW"
 
     def compose(self) -> ComposeResult:
         yield Static("PREVIEW", id="preview-header")
         with VerticalScroll(id="preview-scroll"):
             yield Markdown(id="preview-content", open_links=False)
 
-    @property
+    @cached_property
+    def header(self) -> Static:
+        return self.query_one("#preview-header", Static)
+
+    def set_header(self, text: str) -> None:
+        """Update the header text, skipping the repaint if it is unchanged."""
+        if text != self._header_text:
+            self._header_text = text
+            self.header.update(text)
+
+    @cached_property
     def scroll_view(self) -> VerticalScroll:
         return self.query_one("#preview-scroll", VerticalScroll)
 
-    @property
+    @cached_property
     def markdown_widget(self) -> Markdown:
         return self.query_one("#preview-content", Markdown)
 
@@ -171,15 +205,14 @@ class Preview(Vertical):
         """
         self._current_file = file_path
 
-        header = self.query_one("#preview-header", Static)
         markdown = self.markdown_widget
 
         if file_path is None:
-            header.update("PREVIEW")
+            self.set_header("PREVIEW")
             await markdown.update("")
             return
 
-        header.update(f"PREVIEW - {file_path.name}")
+        self.set_header(f"PREVIEW - {file_path.name}")
 
         # Load content (blocking I/O)
         content, error = load_file_content(file_path)
@@ -189,21 +222,21 @@ class Preview(Vertical):
             await markdown.update(content)
 
     async def show_content(
-        self, file_path: Path, content: str | None, error: str | None
+        self, file_path: Path | None, content: str | None, error: str | None
     ) -> None:
         """Display pre-loaded content (no I/O, safe for main thread).
 
         Args:
-            file_path: The file being displayed (for header and tracking)
+            file_path: The file being displayed (for header and tracking),
+                or None for content that is not backed by a file
             content: Pre-processed markdown content, or None if error
             error: Error message to display, or None if successful
         """
         self._current_file = file_path
 
-        header = self.query_one("#preview-header", Static)
         markdown = self.markdown_widget
 
-        header.update(f"PREVIEW - {file_path.name}")
+        self.set_header(f"PREVIEW - {file_path.name}" if file_path else "PREVIEW")
 
         if error:
             await markdown.update(error)
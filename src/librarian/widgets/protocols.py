@@ -31,12 +31,14 @@ class HasFileHighlighted(Protocol):
         file_path: Path
 
     def get_selected_file(self) -> Path | None: ...
+    def contains(self, file_path: Path) -> bool: ...
     def update_files(
         self,
         files: list[Path],
         tag: str | None = ...,
         navigation_target: str | None = ...,
     ) -> None: ...
+    async def refresh_files(self, files: list[Path], tag: str | None) -> None: ...
 
 
 @runtime_checkable
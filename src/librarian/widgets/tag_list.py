@@ -1,5 +1,6 @@
 """Tag list widget with Tools sidebar for Librarian."""
 
+from functools import cached_property
 from pathlib import Path
 from typing import Iterable
 
@@ -197,6 +198,7 @@ class TagList(Vertical):
     def __init__(self, scan_directory: Path | None = None, **kwargs) -> None:
         super().__init__(**kwargs)
         self._all_tags: list[tuple[str, int]] = []
+        self._tag_name_to_index: dict[str, int] = {}  # Lowercased name -> list index
         self._scan_directory = scan_directory or Path.home()
         self.active_tool: str = "tags"
         self._tags_show_all: bool = False
@@ -227,15 +229,15 @@ class TagList(Vertical):
                 classes="content-section hidden",
             )
 
-    @property
+    @cached_property
     def tools_list_view(self) -> ListView:
         return self.query_one("#tools-list-view", ListView)
 
-    @property
+    @cached_property
     def all_tags_list_view(self) -> ListView:
         return self.query_one("#all-tags-list-view", ListView)
 
-    @property
+    @cached_property
     def directory_tree(self) -> MarkdownDirectoryTree:
         return self.query_one("#directory-tree", MarkdownDirectoryTree)
 
@@ -280,8 +282,10 @@ class TagList(Vertical):
 
         if set(new_tags_dict.keys()) != set(existing_tags.keys()):
             list_view.clear()
-            for tag_name, count in new_tags:
+            self._tag_name_to_index = {}
+            for i, (tag_name, count) in enumerate(new_tags):
                 list_view.append(TagItem(tag_name, count))
+                self._tag_name_to_index.setdefault(tag_name.lower(), i)
             # Add "show more" item if truncated
             if total_count > len(new_tags):
                 list_view.append(ShowMoreItem(total_count, len(new_tags)))
@@ -294,6 +298,10 @@ class TagList(Vertical):
                 label = item.query_one(Label)
                 label.update(f"#{tag_name} ({new_count})")
 
+    def index_of_tag(self, tag_name: str) -> int | None:
+        """Get the list index of a displayed tag (case-insensitive), or None."""
+        return self._tag_name_to_index.get(tag_name.lower())
+
     def _restore_selection(self, tag_name: str) -> None:
         """Restore selection to a specific tag if it exists."""
         all_list = self.all_tags_list_view
@@ -302,7 +310,7 @@ class TagList(Vertical):
                 all_list.index = i
                 return
 
-    @property
+    @cached_property
     def calendar_list(self) -> CalendarList:
         return self.query_one("#calendar-list", CalendarList)
 
@@ -20,6 +20,8 @@ def tmp_index(tmp_path):
     database._index_loaded = False
     database._batch_mode = False
     database._batch_dirty = False
+    database._wiki_link_cache.clear()
+    database._tag_snapshot = None
 
 
 @pytest.fixture
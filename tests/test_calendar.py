@@ -0,0 +1,47 @@
+"""Tests for librarian.calendar event caching."""
+
+import time
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from librarian import calendar
+from librarian.calendar import CalendarEvent, clear_cache, get_cached_events
+
+
+@pytest.fixture
+def cached_events():
+    """Seed the event cache as if icalPal had just been run, and clear it after."""
+    now = datetime.now()
+    events = [
+        CalendarEvent(uid="1", title="Standup", start=now, end=now, calendar_name="Work"),
+        CalendarEvent(uid="2", title="Dentist", start=now, end=now, calendar_name="Home"),
+    ]
+    calendar._cache_result = events
+    calendar._cache_time = time.time()
+    calendar._cache_date = date.today()
+    yield events
+    clear_cache()
+
+
+class TestGetCachedEvents:
+    def test_empty_cache(self):
+        assert get_cached_events() is None
+
+    def test_returns_cached_events(self, cached_events):
+        assert get_cached_events() == cached_events
+
+    def test_filters_by_calendar_name(self, cached_events):
+        assert [e.uid for e in get_cached_events("Home")] == ["2"]
+
+    def test_expired_after_ttl(self, cached_events):
+        calendar._cache_time = time.time() - calendar._CACHE_TTL
+        assert get_cached_events() is None
+
+    def test_stale_from_previous_day(self, cached_events):
+        calendar._cache_date = date.today() - timedelta(days=1)
+        assert get_cached_events() is None
+
+    def test_clear_cache(self, cached_events):
+        clear_cache()
+        assert get_cached_events() is None
@@ -0,0 +1,52 @@
+"""Tests for librarian.widgets.calendar_list."""
+
+import asyncio
+from datetime import datetime
+
+from textual.app import App, ComposeResult
+
+from librarian.calendar import CalendarEvent
+from librarian.widgets import CalendarList
+
+
+class CalendarApp(App):
+    """Minimal app hosting a CalendarList and recording highlighted meetings."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.selected: list[str] = []
+
+    def compose(self) -> ComposeResult:
+        yield CalendarList(id="calendar-list")
+
+    def on_calendar_list_meeting_selected(self, event: CalendarList.MeetingSelected) -> None:
+        self.selected.append(event.event.uid)
+
+
+def make_events() -> list[CalendarEvent]:
+    start = datetime(2026, 1, 5, 9, 0)
+    return [
+        CalendarEvent(uid="1", title="Standup", start=start, end=start, calendar_name="Work"),
+        CalendarEvent(uid="2", title="Review", start=start, end=start, calendar_name="Work"),
+    ]
+
+
+class TestUpdateEvents:
+    def test_reopening_with_same_events_reselects_meeting(self):
+        async def run() -> list[str]:
+            app = CalendarApp()
+            async with app.run_test() as pilot:
+                calendar_list = app.query_one(CalendarList)
+                calendar_list.update_events(make_events())
+                await pilot.pause()
+                calendar_list.list_view.index = 1
+                await pilot.pause()
+                app.selected.clear()
+
+                # Panel reopened with the same (cached) events
+                calendar_list.update_events(make_events())
+                await pilot.pause()
+                assert calendar_list.list_view.index == 1
+                return app.selected
+
+        assert asyncio.run(run()) == ["2"]
@@ -0,0 +1,82 @@
+"""Tests for librarian.calendar_store module."""
+
+import json
+
+import pytest
+
+from librarian import calendar_store
+from librarian.calendar_store import (
+    get_all_associations,
+    get_association,
+    init_store,
+    remove_association,
+    remove_associations_for_file,
+    set_association,
+)
+
+
+@pytest.fixture
+def store_dir(tmp_path):
+    """Initialize the association store in a temp directory and clean up after."""
+    init_store(tmp_path)
+    yield tmp_path
+    calendar_store._store_path = None
+    calendar_store._associations = {}
+    calendar_store._association_paths.clear()
+
+
+@pytest.fixture
+def note(tmp_path):
+    path = tmp_path / "meeting.md"
+    path.write_text("# Meeting\n\n#meetings\n")
+    return path
+
+
+class TestAssociations:
+    def test_set_and_get(self, store_dir, note):
+        set_association("uid-1", note)
+        assert get_association("uid-1") == note
+
+    def test_get_missing(self, store_dir):
+        assert get_association("unknown") is None
+
+    def test_persists_across_init(self, store_dir, note):
+        set_association("uid-1", note)
+        init_store(store_dir)
+        assert get_association("uid-1") == note
+
+    def test_get_drops_file_deleted_after_init(self, store_dir, note):
+        set_association("uid-1", note)
+        note.unlink()
+        assert get_association("uid-1") is None
+        assert get_all_associations() == {}
+        data = json.loads((store_dir / "calendar_associations.json").read_text())
+        assert data["associations"] == {}
+
+    def test_remove_association(self, store_dir, note):
+        set_association("uid-1", note)
+        remove_association("uid-1")
+        assert get_association("uid-1") is None
+        assert get_all_associations() == {}
+
+    def test_remove_associations_for_file(self, store_dir, note):
+        set_association("uid-1", note)
+        set_association("uid-2", note)
+        remove_associations_for_file(note)
+        assert get_all_associations() == {}
+        data = json.loads((store_dir / "calendar_associations.json").read_text())
+        assert data["associations"] == {}
+
+
+class TestPrefetch:
+    def test_init_keeps_missing_files_until_looked_up(self, store_dir, note, tmp_path):
+        set_association("uid-1", note)
+        set_association("uid-2", tmp_path / "gone.md")
+        init_store(store_dir)
+        # Init doesn't stat or rewrite the store
+        data = json.loads((store_dir / "calendar_associations.json").read_text())
+        assert list(data["associations"]) == ["uid-1", "uid-2"]
+        assert get_all_associations() == {"uid-1": note}
+        assert get_association("uid-2") is None
+        data = json.loads((store_dir / "calendar_associations.json").read_text())
+        assert list(data["associations"]) == ["uid-1"]
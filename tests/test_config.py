@@ -16,6 +16,10 @@ class TestConfigDefaults:
         config = Config()
         assert config.editor == "vim"
 
+    def test_default_editor_is_terminal(self):
+        config = Config()
+        assert config.editor_is_gui is False
+
     def test_default_data_directory(self):
         config = Config()
         assert config.data_directory == get_default_data_dir()
@@ -24,6 +28,12 @@ class TestConfigDefaults:
         config = Config()
         assert config.get_index_path() == config.data_directory / "index.json"
 
+    def test_get_index_path_follows_data_directory(self, tmp_path):
+        config = Config(data_directory=tmp_path / "a")
+        assert config.get_index_path() == tmp_path / "a" / "index.json"
+        config.data_directory = tmp_path / "b"
+        assert config.get_index_path() == tmp_path / "b" / "index.json"
+
     def test_default_tag_config(self):
         config = Config()
         assert config.tags.mode == "all"
@@ -58,7 +68,9 @@ class TestConfigSaveLoad:
         original = Config(
             scan_directory=tmp_path / "docs",
             editor="nano",
+            editor_is_gui=True,
             taskpaper="/usr/local/bin/taskpapertui",
+            watcher_debounce=1.5,
             tags=TagConfig(mode="whitelist", whitelist=["python", "rust"]),
             export_directory=tmp_path / "exports",
             data_directory=tmp_path / "data",
@@ -70,7 +82,9 @@ class TestConfigSaveLoad:
         loaded = Config.load()
         assert loaded.scan_directory == original.scan_directory
         assert loaded.editor == original.editor
+        assert loaded.editor_is_gui is True
         assert loaded.taskpaper == original.taskpaper
+        assert loaded.watcher_debounce == 1.5
         assert loaded.tags.mode == original.tags.mode
         assert loaded.tags.whitelist == original.tags.whitelist
         assert loaded.export_directory == original.export_directory
@@ -106,6 +120,8 @@ class TestConfigSaveLoad:
         assert config.scan_directory == Path("/tmp/docs")
         assert config.editor == "code"
         # Defaults for missing fields
+        assert config.editor_is_gui is False
+        assert config.watcher_debounce == 0.5
         assert config.tags.mode == "all"
         assert config.calendar.enabled is True
 
@@ -5,6 +5,7 @@ from pathlib import Path
 
 import pytest
 
+from librarian import database
 from librarian.database import (
     add_file,
     batch_writes,
@@ -12,9 +13,14 @@ from librarian.database import (
     get_all_files,
     get_all_tags,
     get_file_mtime,
+    get_file_tags,
+    get_file_paths_by_tag,
     get_files_by_tag,
+    get_generation,
+    get_tag_snapshot,
     init_database,
     remove_file,
+    rename_file,
     resolve_wiki_link,
     search_files,
 )
@@ -62,6 +68,13 @@ class TestAddRemoveFile:
         init_database(tmp_index)
         assert get_file_mtime(path) == 100.0
 
+    def test_saved_index_is_compact_json(self, tmp_index):
+        add_file(Path("/tmp/test.md"), 100.0, ["python"])
+        text = tmp_index.read_text()
+        assert "\n" not in text
+        assert json.loads(text) == {"files": {"/tmp/test.md": {"mtime": 100.0, "tags": ["python"]}}}
+        assert not tmp_index.with_suffix(".json.tmp").exists()
+
     def test_update_file(self, tmp_index):
         path = Path("/tmp/test.md")
         add_file(path, 100.0, ["python"])
@@ -82,10 +95,30 @@ class TestAddRemoveFile:
         # Should not raise
         remove_file(Path("/tmp/nonexistent.md"))
 
+    def test_rename_file_keeps_entry(self, tmp_index):
+        add_file(Path("/tmp/old.md"), 100.0, ["python"])
+        assert rename_file(Path("/tmp/old.md"), Path("/tmp/new.md")) is True
+        assert get_file_mtime(Path("/tmp/old.md")) is None
+        assert get_file_mtime(Path("/tmp/new.md")) == 100.0
+        assert get_file_tags(Path("/tmp/new.md")) == ["python"]
+
+    def test_rename_unindexed_file(self, tmp_index):
+        assert rename_file(Path("/tmp/missing.md"), Path("/tmp/new.md")) is False
+        assert get_all_files() == []
+
     def test_get_file_mtime_missing(self, tmp_index):
         assert get_file_mtime(Path("/tmp/missing.md")) is None
 
 
+class TestGetFileTags:
+    def test_returns_indexed_tags(self, tmp_index):
+        add_file(Path("/tmp/a.md"), 100.0, ["python", "coding"])
+        assert get_file_tags(Path("/tmp/a.md")) == ["python", "coding"]
+
+    def test_unindexed_file(self, tmp_index):
+        assert get_file_tags(Path("/tmp/missing.md")) == []
+
+
 class TestGetAllTags:
     def test_empty_index(self, tmp_index):
         assert get_all_tags() == []
@@ -137,6 +170,66 @@ class TestGetFilesByTag:
         assert get_files_by_tag("nonexistent") == []
 
 
+class TestGetFilePathsByTag:
+    def test_returns_paths_sorted_by_mtime_descending(self, tmp_index):
+        add_file(Path("/tmp/old.md"), 100.0, ["python"])
+        add_file(Path("/tmp/new.md"), 300.0, ["python"])
+        add_file(Path("/tmp/other.md"), 200.0, ["rust"])
+        assert get_file_paths_by_tag("python") == [
+            Path("/tmp/new.md"),
+            Path("/tmp/old.md"),
+        ]
+
+    def test_matches_get_files_by_tag(self, tmp_index):
+        add_file(Path("/tmp/a.md"), 100.0, ["python"])
+        add_file(Path("/tmp/c.md"), 300.0, ["python", "rust"])
+        expected = [f[0] for f in get_files_by_tag("python")]
+        assert get_file_paths_by_tag("python") == expected
+
+    def test_nonexistent_tag(self, tmp_index):
+        assert get_file_paths_by_tag("nonexistent") == []
+
+    def test_cache_invalidated_by_index_change(self, tmp_index):
+        add_file(Path("/tmp/a.md"), 100.0, ["python"])
+        generation = get_generation()
+        assert get_file_paths_by_tag("python") == [Path("/tmp/a.md")]
+        add_file(Path("/tmp/b.md"), 200.0, ["python"])
+        assert get_generation() != generation
+        assert get_file_paths_by_tag("python") == [Path("/tmp/b.md"), Path("/tmp/a.md")]
+        remove_file(Path("/tmp/b.md"))
+        assert get_file_paths_by_tag("python") == [Path("/tmp/a.md")]
+
+
+class TestGetTagSnapshot:
+    def test_empty_index(self, tmp_index):
+        assert get_tag_snapshot() == ([], {})
+
+    def test_matches_separate_queries(self, tmp_index):
+        add_file(Path("/tmp/a.md"), 100.0, ["python", "rust"])
+        add_file(Path("/tmp/b.md"), 200.0, ["python"])
+        add_file(Path("/tmp/c.md"), 300.0, ["go"])
+        # Looked up before the snapshot exists, so these scan the index
+        expected = {tag: get_file_paths_by_tag(tag) for tag in ("python", "rust", "go")}
+        tags, files_by_tag = get_tag_snapshot()
+        assert tags == get_all_tags()
+        assert files_by_tag == expected
+
+    def test_reused_until_index_changes(self, tmp_index):
+        add_file(Path("/tmp/a.md"), 100.0, ["python"])
+        first = get_tag_snapshot()
+        assert get_tag_snapshot() is first
+        add_file(Path("/tmp/b.md"), 200.0, ["python"])
+        assert get_tag_snapshot()[0] == [("python", 2)]
+
+    def test_serves_file_lookups(self, tmp_index, monkeypatch):
+        add_file(Path("/tmp/a.md"), 100.0, ["python"])
+        add_file(Path("/tmp/b.md"), 200.0, ["python", "rust"])
+        _, files_by_tag = get_tag_snapshot()
+        monkeypatch.setattr(database, "_index", {})
+        assert get_file_paths_by_tag("python") is files_by_tag["python"]
+        assert get_file_paths_by_tag("missing") == []
+
+
 class TestSearchFiles:
     def test_search_by_filename(self, tmp_index):
         add_file(Path("/tmp/python-guide.md"), 100.0, ["tutorial"])
@@ -193,6 +286,17 @@ class TestResolveWikiLink:
         result = resolve_wiki_link("sibling.md", current)
         assert result == target.resolve()
 
+    def test_cache_evicts_least_recently_used(self, tmp_index, tmp_path, monkeypatch):
+        monkeypatch.setattr(database, "_WIKI_LINK_CACHE_SIZE", 2)
+        for name in ("a.md", "b.md", "c.md"):
+            (tmp_path / name).write_text("content")
+            add_file(tmp_path / name, 100.0, ["test"])
+        resolve_wiki_link("a.md")
+        resolve_wiki_link("b.md")
+        resolve_wiki_link("a.md")  # Refresh a, so b is the oldest
+        resolve_wiki_link("c.md")
+        assert [key[0] for key in database._wiki_link_cache] == ["a.md", "c.md"]
+
     def test_resolve_not_found(self, tmp_index):
         result = resolve_wiki_link("nonexistent.md")
         assert result is None
@@ -212,6 +316,36 @@ class TestResolveWikiLink:
         result = resolve_wiki_link("mynote.md")
         assert result == note
 
+    def test_repeat_lookup_served_from_cache(self, tmp_index, tmp_path):
+        note = tmp_path / "note.md"
+        note.write_text("content")
+        add_file(note, 100.0, ["test"])
+        assert resolve_wiki_link("note.md") == note
+        # Bypass add_file so the cache is not invalidated
+        database._index.clear()
+        assert resolve_wiki_link("note.md") == note
+
+    def test_cached_link_dropped_when_file_deleted(self, tmp_index, tmp_path):
+        note = tmp_path / "note.md"
+        note.write_text("content")
+        add_file(note, 100.0, ["test"])
+        assert resolve_wiki_link("note.md") == note
+        note.unlink()
+        assert resolve_wiki_link("note.md") is None
+
+    def test_index_change_invalidates_cache(self, tmp_index, tmp_path):
+        first = tmp_path / "a" / "note.md"
+        first.parent.mkdir()
+        first.write_text("content")
+        add_file(first, 100.0, ["test"])
+        assert resolve_wiki_link("note.md") == first
+        remove_file(first)
+        second = tmp_path / "b" / "note.md"
+        second.parent.mkdir()
+        second.write_text("content")
+        add_file(second, 200.0, ["test"])
+        assert resolve_wiki_link("note.md") == second
+
 
 class TestBatchWrites:
     def test_batch_defers_writes(self, tmp_index):
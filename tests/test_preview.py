@@ -0,0 +1,70 @@
+"""Tests for librarian.widgets.preview content loading."""
+
+import os
+
+import pytest
+
+from librarian.widgets import preview
+from librarian.widgets.preview import get_cached_content, load_file_content
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    monkeypatch.setattr(preview, "_file_cache", preview.FileCache(max_size=2))
+
+
+class TestLoadFileContent:
+    def test_caches_processed_content(self, tmp_path):
+        f = tmp_path / "note.md"
+        f.write_text("See [[other.md]]\n")
+        content, error = load_file_content(f)
+        assert error is None
+        assert get_cached_content(f) == content
+
+    def test_not_cached_before_first_load(self, tmp_path):
+        f = tmp_path / "note.md"
+        f.write_text("hello\n")
+        assert get_cached_content(f) is None
+
+    def test_change_invalidates(self, tmp_path):
+        f = tmp_path / "note.md"
+        f.write_text("one\n")
+        load_file_content(f)
+        st = f.stat()
+        f.write_text("two two\n")
+        os.utime(f, ns=(st.st_atime_ns, st.st_mtime_ns))
+        # Same mtime, different size
+        assert get_cached_content(f) is None
+        content, _ = load_file_content(f)
+        assert "two two" in content
+
+    def test_lru_eviction(self, tmp_path):
+        files = []
+        for name in ("a.md", "b.md", "c.md"):
+            f = tmp_path / name
+            f.write_text(name)
+            load_file_content(f)
+            files.append(f)
+        assert get_cached_content(files[0]) is None
+        assert get_cached_content(files[2]) is not None
+
+    def test_missing_file_returns_error(self, tmp_path):
+        content, error = load_file_content(tmp_path / "missing.md")
+        assert content is None
+        assert error.startswith("*Error reading file")
+
+    def test_large_file_truncated(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(preview, "PREVIEW_MAX_BYTES", 8)
+        f = tmp_path / "big.md"
+        f.write_text("abcdefgé and more\n")
+        content, error = load_file_content(f)
+        assert error is None
+        # The two-byte "é" straddles the cap and is dropped, not mangled
+        assert content == "abcdefg" + preview.TRUNCATED_MARKER
+
+    def test_file_at_cap_not_truncated(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(preview, "PREVIEW_MAX_BYTES", 8)
+        f = tmp_path / "exact.md"
+        f.write_text("abcdefgh")
+        content, _ = load_file_content(f)
+        assert content == "abcdefgh"
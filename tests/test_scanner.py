@@ -1,14 +1,17 @@
 """Tests for librarian.scanner module."""
 
+import os
 from pathlib import Path
 
 import pytest
 
+from librarian import database, scanner
 from librarian.scanner import (
     TAG_PATTERN,
     extract_tags,
     find_scannable_files,
     rescan_file,
+    rescan_moved_file,
     scan_directory,
     scan_file,
 )
@@ -114,6 +117,16 @@ class TestFindScannableFiles:
 
 
 class TestScanDirectory:
+    def test_reuses_loaded_index(self, tmp_index, sample_config, monkeypatch):
+        scan_directory(sample_config)
+        loads = []
+        monkeypatch.setattr(
+            database, "_load_index_from_disk", lambda: loads.append(True) or {}
+        )
+        scan_directory(sample_config)
+        assert loads == []
+        assert len(get_all_files()) == 4
+
     def test_scan_adds_files_with_tags(self, tmp_index, sample_config):
         added, updated, removed = scan_directory(sample_config)
         # note1, note2, tasks.taskpaper, deep.md have tags; note3 does not
@@ -150,6 +163,52 @@ class TestScanDirectory:
         # All files with tags should be "updated"
         assert updated == 4
 
+    def test_unchanged_tagged_files_not_reread(self, tmp_index, sample_config, monkeypatch):
+        scan_directory(sample_config)
+
+        scanned = []
+        original = scanner._read_tags
+
+        def recording_read_tags(path_str):
+            scanned.append(Path(path_str).name)
+            return original(path_str)
+
+        monkeypatch.setattr(scanner, "_read_tags", recording_read_tags)
+        added, updated, removed = scan_directory(sample_config)
+        assert (added, updated, removed) == (0, 0, 0)
+        # Only the untagged file is read again, since it is never indexed
+        assert scanned == ["note3.md"]
+
+    def test_parallel_scan_matches_serial(self, tmp_index, sample_config, monkeypatch):
+        monkeypatch.setattr(scanner, "PARALLEL_SCAN_THRESHOLD", 1)
+        added, _, _ = scan_directory(sample_config)
+        assert added == 4
+        assert {name for name, _ in get_all_tags()} == {
+            "python", "coding", "testing", "taskpaper", "deep"
+        }
+
+    def test_reports_progress_while_scanning(self, tmp_index, sample_config, monkeypatch):
+        monkeypatch.setattr(scanner, "PROGRESS_INTERVAL", 2)
+        seen = []
+        scan_directory(sample_config, on_progress=lambda: seen.append(len(get_all_files())))
+        # Five files are read; progress is reported after the 2nd and 4th
+        assert len(seen) == 2
+        assert 0 < seen[0] < seen[1] <= 4
+
+    def test_no_progress_when_nothing_changed(self, tmp_index, sample_config, monkeypatch):
+        scan_directory(sample_config)
+        monkeypatch.setattr(scanner, "PROGRESS_INTERVAL", 1)
+        seen = []
+        scan_directory(sample_config, on_progress=lambda: seen.append(True))
+        assert seen == []
+
+    def test_whitelist_applies_to_scan(self, tmp_index, sample_config):
+        sample_config.tags.mode = "whitelist"
+        sample_config.tags.whitelist = ["Python"]
+        added, _, _ = scan_directory(sample_config)
+        assert added == 3
+        assert [name for name, _ in get_all_tags()] == ["python"]
+
 
 class TestRescanFile:
     def test_rescan_existing_file(self, tmp_index, sample_config):
@@ -167,3 +226,55 @@ class TestRescanFile:
         path = Path("/nonexistent/file.md")
         result = rescan_file(path, sample_config)
         assert result is False
+
+
+class TestRescanMovedFile:
+    def test_moves_index_entry(self, tmp_index, sample_config):
+        old_path = sample_config.scan_directory / "note1.md"
+        rescan_file(old_path, sample_config)
+        new_path = sample_config.scan_directory / "renamed.md"
+        old_path.rename(new_path)
+
+        result = rescan_moved_file(old_path, new_path, sample_config)
+        assert result is True
+        assert get_file_mtime(old_path) is None
+        assert get_file_mtime(new_path) is not None
+
+    def test_unchanged_file_not_reread(self, tmp_index, sample_config, monkeypatch):
+        old_path = sample_config.scan_directory / "note1.md"
+        rescan_file(old_path, sample_config)
+        new_path = sample_config.scan_directory / "renamed.md"
+        old_path.rename(new_path)
+
+        def fail_read_tags(path_str):
+            raise AssertionError("renamed file should not be reread")
+
+        monkeypatch.setattr(scanner, "_read_tags", fail_read_tags)
+        assert rescan_moved_file(old_path, new_path, sample_config) is True
+        assert {name for name, _ in get_all_tags()} == {"python", "coding"}
+
+    def test_modified_file_is_reread(self, tmp_index, sample_config):
+        old_path = sample_config.scan_directory / "note1.md"
+        rescan_file(old_path, sample_config)
+        new_path = sample_config.scan_directory / "renamed.md"
+        old_path.rename(new_path)
+        new_path.write_text("#changed\n")
+        os.utime(new_path, (1, 1))
+
+        assert rescan_moved_file(old_path, new_path, sample_config) is True
+        assert [name for name, _ in get_all_tags()] == ["changed"]
+        assert get_file_mtime(old_path) is None
+
+    def test_writes_index_once(self, tmp_index, sample_config, monkeypatch):
+        old_path = sample_config.scan_directory / "note1.md"
+        rescan_file(old_path, sample_config)
+        new_path = sample_config.scan_directory / "renamed.md"
+        old_path.rename(new_path)
+
+        writes = []
+        original_replace = database.os.replace
+        monkeypatch.setattr(
+            database.os, "replace", lambda *a: writes.append(a) or original_replace(*a)
+        )
+        rescan_moved_file(old_path, new_path, sample_config)
+        assert len(writes) == 1